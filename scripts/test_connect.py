@@ -20,7 +20,9 @@ Usage:
 
 import argparse
 import asyncio
+import io
 import sys
+from typing import AsyncIterator
 
 import asyncssh
 
@@ -112,6 +114,37 @@ async def run_test(host: str, port: int, username: str, password: str) -> int:
         return 1
 
 
+async def _iter_until_idle(
+    stream: asyncssh.SSHReader, idle: float = 1.0, chunk_size: int = 4096
+) -> AsyncIterator[bytes]:
+    """
+    Yield chunks from stream until no new data arrives for `idle` seconds.
+
+    Args:
+        stream: Async reader to consume from.
+        idle: Seconds of silence before stopping.
+        chunk_size: Max bytes per read.
+
+    Yields:
+        Each chunk as it is read.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + idle
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        try:
+            data = await asyncio.wait_for(stream.read(chunk_size), timeout=remaining)
+        except asyncio.TimeoutError:
+            return
+        if not data:
+            return
+        yield data
+        # Data arrived; restart the idle window
+        deadline = loop.time() + idle
+
+
 async def _read_until_idle(
     stream: asyncssh.SSHReader, idle: float = 1.0, chunk_size: int = 4096
 ) -> bytes:
@@ -126,16 +159,10 @@ async def _read_until_idle(
     Returns:
         All accumulated bytes.
     """
-    buf = bytearray()
-    while True:
-        try:
-            data = await asyncio.wait_for(stream.read(chunk_size), timeout=idle)
-            if not data:
-                break
-            buf.extend(data)
-        except asyncio.TimeoutError:
-            break
-    return bytes(buf)
+    buf = io.BytesIO()
+    async for data in _iter_until_idle(stream, idle=idle, chunk_size=chunk_size):
+        buf.write(data)
+    return buf.getvalue()
 
 
 def main() -> int:
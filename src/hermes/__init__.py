@@ -9,6 +9,16 @@ __version__ = "0.1.0"
 __author__ = "Hermes Contributors"
 __license__ = "MIT"
 
-from hermes.config import Config
+from typing import Any
 
 __all__ = ["Config", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Config pulls in pydantic; load it on first access rather than on every
+    # import of the package (e.g. `python -m hermes --help`).
+    if name == "Config":
+        from hermes.config import Config
+
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,20 +6,22 @@ This module provides the main() function that starts the SSH honeypot server.
 
 import argparse
 import asyncio
+import functools
 import logging
+import os
+import signal
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import docker.errors
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 
 from hermes import __version__
-from hermes.config import Config
-from hermes.container.pool import ContainerPool
-from hermes.server.asyncssh_backend import AsyncSSHBackend
-from hermes.server.backend import PTYRequest, SessionInfo
-from hermes.session.proxy import ContainerProxy
-from hermes.session.recorder import SessionRecorder
+
+# docker, asyncssh and pydantic are imported where they are first needed so
+# that --help and --version return without loading them.
+if TYPE_CHECKING:
+    from hermes.config import Config
+    from hermes.container.pool import ContainerPool
+    from hermes.server.backend import PTYRequest, SessionInfo
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -31,8 +33,24 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+def _event_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Return uvloop's loop factory if uvloop is installed.
+
+    uvloop's libuv-based selector and transports cut per-callback overhead
+    on the socket-heavy proxy path. Falls back to the default asyncio loop
+    when uvloop is unavailable (e.g. on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return cast(Callable[[], asyncio.AbstractEventLoop], uvloop.new_event_loop)
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(
         description="Hermes - SSH Honeypot with Docker Container Sandboxing",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -59,21 +77,37 @@ def parse_args() -> argparse.Namespace:
         help="Set logging level (default: INFO)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of server processes sharing the SSH port via SO_REUSEPORT; "
+            "each worker runs its own container pool (default: server.workers "
+            "from the configuration file)"
+        ),
+    )
+
     parser.add_argument(
         "--generate-keys",
         action="store_true",
         help="Generate SSH host keys and exit",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
 
 async def container_session_handler(
-    session_info: SessionInfo,
-    pty_request: PTYRequest,
+    session_info: "SessionInfo",
+    pty_request: "PTYRequest",
     process: object,
-    container_pool: ContainerPool,
-    config: Config,
+    container_pool: "ContainerPool",
+    config: "Config",
     recording_config=None,
 ) -> None:
     """
@@ -95,8 +129,11 @@ async def container_session_handler(
         config: Complete Hermes configuration
         recording_config: Optional RecordingConfig for session recording
     """
+    from hermes.session.proxy import ContainerProxy
+    from hermes.session.recorder import SessionRecorder
+
     logger = logging.getLogger(__name__)
-    logger.info(f"container_session_handler called for session {session_info.session_id}")
+    logger.info("container_session_handler called for session %s", session_info.session_id)
     container = None
     proxy = None
     recorder = None
@@ -106,11 +143,11 @@ async def container_session_handler(
     try:
         # Step 1: Allocate container
         _stage = "allocating container"
-        logger.info(f"Allocating container for session {session_info.session_id}")
+        logger.info("Allocating container for session %s", session_info.session_id)
         container = await container_pool.allocate(session_info.session_id)
 
         # Step 2: Create recorder
-        if recording_config:
+        if recording_config and recording_config.enabled:
             recorder = SessionRecorder(
                 config=recording_config,
                 session_id=session_info.session_id,
@@ -145,7 +182,9 @@ async def container_session_handler(
 
         async def timeout_monitor() -> None:
             """Monitor session duration and trigger cleanup on timeout."""
-            logger.info(f"Session timeout set to {timeout_seconds}s for {session_info.session_id}")
+            logger.info(
+                "Session timeout set to %ss for %s", timeout_seconds, session_info.session_id
+            )
             try:
                 await asyncio.sleep(timeout_seconds)
             except asyncio.CancelledError:
@@ -154,7 +193,9 @@ async def container_session_handler(
                     return
                 raise  # Re-raise if cancelled for other reasons
             timeout_expired.set()
-            logger.warning(f"Session {session_info.session_id} timeout expired, initiating cleanup")
+            logger.warning(
+                "Session %s timeout expired, initiating cleanup", session_info.session_id
+            )
 
         timeout_task = asyncio.create_task(timeout_monitor())
         container_task = asyncio.create_task(proxy.wait_completion())
@@ -180,7 +221,7 @@ async def container_session_handler(
 
         # Handle timeout expiration
         if timeout_expired.is_set():
-            logger.info(f"Session {session_info.session_id} timed out, releasing container")
+            logger.info("Session %s timed out, releasing container", session_info.session_id)
             try:
                 error_msg = b"\r\nSession timeout - connection closed\r\n"
                 process.stdout.write(error_msg)
@@ -190,7 +231,7 @@ async def container_session_handler(
 
     except Exception as e:
         # Different error messages depending on the stage at which failure occurred
-        logger.error(f"Session handler error during {_stage}: {e}")
+        logger.error("Session handler error during %s: %s", _stage, e)
         try:
             if _stage == "allocating container":
                 error_msg = b"\r\nContainer allocation failed - connection closed\r\n"
@@ -219,72 +260,103 @@ async def container_session_handler(
             await proxy.stop()
 
         if recorder:
-            recorder.stop()
+            await recorder.stop()
             recorder.write_metadata()
 
         if container:
-            logger.info(f"Releasing container for session {session_info.session_id}")
+            logger.info("Releasing container for session %s", session_info.session_id)
             await container_pool.release(session_info.session_id)
 
 
-async def async_main(config_path: Path) -> int:
+async def async_main(config_path: Path, workers: int = 1) -> int:
     """
     Asynchronous main function.
 
     Args:
         config_path: Path to configuration file
+        workers: Total number of server processes sharing the SSH port
 
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    import docker
+
+    from hermes.config import Config
+    from hermes.container.pool import ContainerPool
+    from hermes.server.asyncssh_backend import AsyncSSHBackend
+
     logger = logging.getLogger(__name__)
+    loop = asyncio.get_running_loop()
+    stop_signals: List[signal.Signals] = []
     ssh_backend = None
     container_pool = None
     docker_client = None
 
     try:
         # Load configuration
-        logger.info(f"Loading configuration from {config_path}")
-        config = Config.from_file(config_path)
+        logger.info("Loading configuration from %s", config_path)
+        config = await asyncio.to_thread(Config.from_file, config_path)
 
         logger.info("Hermes starting...")
-        logger.info(f"SSH Server: {config.server.host}:{config.server.port}")
-        logger.info(f"Host Key: {config.server.host_key_path}")
-        logger.info(f"Container pool size: {config.container_pool.size}")
-        logger.info(f"Max concurrent sessions: {config.server.max_concurrent_sessions}")
-
-        # Initialize Docker client
+        logger.info("SSH Server: %s:%d", config.server.host, config.server.port)
+        logger.info("Host Key: %s", config.server.host_key_path)
+        logger.info("Container pool size: %d", config.container_pool.size)
+        logger.info("Max concurrent sessions: %d", config.server.max_concurrent_sessions)
+
+        # Initialize Docker client. A single client is shared by the whole
+        # process; size its HTTP connection pool so that every session plus
+        # pool replenishment can talk to Docker at once without waiting on
+        # urllib3's default of 10 connections.
         logger.info("Connecting to Docker...")
+        docker_concurrency = config.server.max_concurrent_sessions + config.container_pool.size
+        max_pool_size = max(docker.constants.DEFAULT_MAX_POOL_SIZE, docker_concurrency)
         if config.docker.base_url:
-            docker_client = docker.DockerClient(base_url=config.docker.base_url)
+            docker_client = docker.DockerClient(
+                base_url=config.docker.base_url, max_pool_size=max_pool_size
+            )
         else:
-            docker_client = docker.from_env()
+            docker_client = docker.from_env(max_pool_size=max_pool_size)
 
-        # Verify Docker connection
-        docker_version = docker_client.version()
-        logger.info(f"Connected to Docker {docker_version.get('Version', 'unknown')}")
-
-        # Initialize container pool
+        # Verify the Docker connection while the container pool warms up. The
+        # version call is a blocking HTTP round-trip, so it runs in a thread.
+        # Both are awaited to completion before any error is raised so that
+        # shutdown never races a half-finished pool initialization.
         logger.info("Initializing container pool...")
-        container_pool = ContainerPool(docker_client, config.container_pool)
-        await container_pool.initialize()
-        logger.info(f"Container pool ready with {config.container_pool.size} containers")
+        container_pool = ContainerPool(
+            docker_client, config.container_pool, max_workers=docker_concurrency
+        )
+        docker_version: BaseException | Dict[str, Any]
+        pool_result: BaseException | None
+        docker_version, pool_result = await asyncio.gather(
+            asyncio.to_thread(docker_client.version),
+            container_pool.initialize(),
+            return_exceptions=True,
+        )
+        if isinstance(docker_version, BaseException):
+            raise docker_version
+        logger.info("Connected to Docker %s", docker_version.get("Version", "unknown"))
+        if isinstance(pool_result, BaseException):
+            raise pool_result
+        logger.info("Container pool ready with %d containers", config.container_pool.size)
 
         # Initialize SSH backend
         logger.info("Initializing SSH backend...")
-        ssh_backend = AsyncSSHBackend(config)
+        ssh_backend = AsyncSSHBackend(config, reuse_port=workers > 1)
 
         # Register container pool with SSH backend
         ssh_backend.set_container_pool(container_pool)
 
-        # Set session handler with container pool closure
+        # Set session handler with container pool closure. Recording being
+        # disabled is resolved once here rather than on every session.
+        recording_config = config.recording if config.recording.enabled else None
+
         async def session_handler_with_pool(
-            session_info: SessionInfo,
-            pty_request: PTYRequest,
+            session_info: "SessionInfo",
+            pty_request: "PTYRequest",
             process: object,
         ) -> None:
             await container_session_handler(
-                session_info, pty_request, process, container_pool, config, config.recording
+                session_info, pty_request, process, container_pool, config, recording_config
             )
 
         ssh_backend.set_session_handler(session_handler_with_pool)
@@ -295,29 +367,35 @@ async def async_main(config_path: Path) -> int:
 
         logger.info("Hermes is running! Press Ctrl+C to stop.")
 
-        # Keep running until interrupted
-        try:
-            await asyncio.Event().wait()
-        except asyncio.CancelledError:
-            pass
+        # Run until SIGINT or SIGTERM (e.g. from `docker stop` or the parent
+        # worker) requests a stop; cleanup then runs in the finally block.
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+            stop_signals.append(sig)
+        await stop_event.wait()
+        logger.info("Stop requested, shutting down...")
 
         return 0
 
     except FileNotFoundError as e:
-        logger.error(f"Configuration file not found: {e}")
+        logger.error("Configuration file not found: %s", e)
         return 1
     except docker.errors.DockerException as e:
-        logger.error(f"Docker error: {e}")
+        logger.error("Docker error: %s", e)
         logger.error("Make sure Docker is running and accessible")
         return 1
     except RuntimeError as e:
-        logger.error(f"Runtime error: {e}")
+        logger.error("Runtime error: %s", e)
         return 1
     except Exception as e:
-        logger.exception(f"Fatal error: {e}")
+        logger.exception("Fatal error: %s", e)
         return 1
     finally:
         # Clean shutdown
+        for sig in stop_signals:
+            loop.remove_signal_handler(sig)
+
         if ssh_backend:
             logger.info("Shutting down SSH server...")
             await ssh_backend.stop()
@@ -333,6 +411,65 @@ async def async_main(config_path: Path) -> int:
         logger.info("Shutdown complete")
 
 
+def _configured_workers(config_path: Path) -> int:
+    """
+    Read the number of server processes from the configuration file.
+
+    Configuration errors are left for async_main to report, so a single
+    worker is assumed when the file cannot be loaded.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Value of server.workers, or 1 if the configuration cannot be loaded
+    """
+    from hermes.config import Config
+
+    try:
+        return Config.from_file(config_path).server.workers
+    except Exception:
+        return 1
+
+
+def _fork_workers(workers: int) -> Optional[List[int]]:
+    """
+    Fork additional server processes so that workers processes run in total.
+
+    Each process runs its own event loop, SSH listener and container pool;
+    the kernel load-balances new connections between listeners bound with
+    SO_REUSEPORT. Authentication state is per process, so accept-all
+    failure counts are tracked per worker.
+
+    Args:
+        workers: Total number of server processes, including this one
+
+    Returns:
+        Child PIDs in the parent process, or None in a child process
+    """
+    children: List[int] = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            return None
+        children.append(pid)
+    return children
+
+
+def _reap_workers(children: List[int]) -> None:
+    """Ask worker processes to stop and wait for them to exit."""
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
 def main() -> int:
     """
     Main entry point for Hermes.
@@ -344,7 +481,7 @@ def main() -> int:
     setup_logging(args.log_level)
 
     logger = logging.getLogger(__name__)
-    logger.info(f"Hermes v{__version__}")
+    logger.info("Hermes v%s", __version__)
 
     # Handle special commands
     if args.generate_keys:
@@ -353,12 +490,34 @@ def main() -> int:
         logger.error("Key generation not yet implemented")
         return 1
 
+    workers = args.workers
+    if workers is None:
+        workers = _configured_workers(args.config)
+
+    if workers < 1:
+        logger.error("--workers must be at least 1")
+        return 1
+
+    # Fork worker processes before any event loop exists
+    children: Optional[List[int]] = []
+    if workers > 1:
+        logger.info("Starting %d worker processes", workers)
+        children = _fork_workers(workers)
+
     # Run async main
     try:
-        return asyncio.run(async_main(args.config))
+        loop_factory = _event_loop_factory()
+        if loop_factory is None:
+            logger.info("Using default asyncio event loop")
+            return asyncio.run(async_main(args.config, workers))
+        logger.info("Using uvloop event loop")
+        return asyncio.run(async_main(args.config, workers), loop_factory=loop_factory)
     except KeyboardInterrupt:
         logger.info("Interrupted by user, shutting down...")
         return 0
+    finally:
+        if children:
+            _reap_workers(children)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,22 @@ Configuration management for Hermes.
 This module handles loading, validating, and accessing configuration from YAML files.
 """
 
+import functools
+import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
 
 class ServerConfig(BaseModel):
     """SSH server configuration."""
@@ -22,6 +31,9 @@ class ServerConfig(BaseModel):
     )
     max_concurrent_sessions: int = Field(default=10, ge=1, description="Max concurrent sessions")
     session_timeout: int = Field(default=3600, ge=60, description="Session timeout in seconds")
+    workers: int = Field(
+        default=1, ge=1, description="Server processes sharing the port via SO_REUSEPORT"
+    )
 
 
 class AuthenticationConfig(BaseModel):
@@ -50,6 +62,29 @@ class ContainerSecurityConfig(BaseModel):
     pids_limit: int = Field(default=100, ge=10, description="Process limit")
     tmpfs_size: str = Field(default="50m", description="Tmpfs size for /tmp")
 
+    @field_validator("cpu_quota")
+    @classmethod
+    def _warn_high_cpu_quota(cls, value: float) -> float:
+        """Warn about CPU quotas that let one session hog the host."""
+        if value > 2.0:
+            logger.warning(
+                "High CPU quota configured: %s cores. "
+                "Consider reducing to prevent resource exhaustion.",
+                value,
+            )
+        return value
+
+    @field_validator("pids_limit")
+    @classmethod
+    def _warn_low_pids_limit(cls, value: int) -> int:
+        """Warn about PID limits too low for a usable shell."""
+        if value < 50:
+            logger.warning(
+                "Very low PIDs limit: %d. Container may fail to spawn necessary processes.",
+                value,
+            )
+        return value
+
     class CapabilityConfig(BaseModel):
         """Linux capabilities configuration."""
 
@@ -67,6 +102,9 @@ class ContainerPoolConfig(BaseModel):
 
     size: int = Field(default=3, ge=1, description="Number of containers in ready pool")
     spawn_timeout: int = Field(default=30, ge=5, description="Timeout for container spawn")
+    create_concurrency: int = Field(
+        default=4, ge=1, description="Max container creations in flight at once"
+    )
     image: str = Field(
         default="hermes-target-ubuntu:latest", description="Target container image"
     )
@@ -76,8 +114,25 @@ class ContainerPoolConfig(BaseModel):
     cleanup_stopped_after_days: int = Field(
         default=7, ge=0, description="Days to keep stopped containers (0 to keep forever)"
     )
+    forensics_max: int = Field(
+        default=1000, ge=1, description="Max stopped containers tracked in memory"
+    )
+    release_strategy: Literal["stop", "pause", "keep_alive"] = Field(
+        default="stop", description="What to do with a container when its session ends"
+    )
+    reset_command: List[str] = Field(
+        default_factory=list,
+        description="Command run inside a container before keep_alive reuse",
+    )
     security: ContainerSecurityConfig = Field(default_factory=ContainerSecurityConfig)
 
+    @model_validator(mode="after")
+    def _require_reset_command(self) -> "ContainerPoolConfig":
+        """keep_alive reuses containers, so it needs a command to reset them."""
+        if self.release_strategy == "keep_alive" and not self.reset_command:
+            raise ValueError("release_strategy 'keep_alive' requires a reset_command")
+        return self
+
 
 class RecordingConfig(BaseModel):
     """Session recording configuration."""
@@ -139,6 +194,11 @@ class Config(BaseSettings):
         """
         Load configuration from a YAML file.
 
+        Parsed YAML is cached by file content, so repeated loads of an
+        unchanged file (or of another file with identical content) skip
+        parsing. Validation runs on every call, so environment overrides are
+        always current.
+
         Args:
             path: Path to YAML configuration file
 
@@ -149,14 +209,22 @@ class Config(BaseSettings):
             FileNotFoundError: If config file doesn't exist
             ValueError: If config file is invalid
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
-
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-
-        return cls(**data)
+        # Binary mode: the loader detects the encoding itself
+        with open(path, "rb") as f:
+            content = f.read()
+        return cls(**_parse_cached(content))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return self.model_dump()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_cached(content: bytes) -> Any:
+    """
+    Parse configuration file content.
+
+    Keying on the raw bytes means any edit to the file invalidates the cached
+    result, however quickly it follows the previous load.
+    """
+    return yaml.load(content, Loader=_SafeLoader)
@@ -8,18 +8,55 @@ and stopped (preserved) after session ends for forensics.
 
 import asyncio
 import logging
-import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import secrets
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
 import docker
+import requests
 from docker.models.containers import Container
 
-from hermes.config import ContainerPoolConfig
-from hermes.container.security import build_container_config
+from hermes.config import ContainerPoolConfig, ServerConfig
+from hermes.container.security import build_container_config, build_container_config_template
 
 logger = logging.getLogger(__name__)
 
+# Attempts per container creation, and the delay before the first retry
+# (doubled for each further retry)
+CREATE_ATTEMPTS = 3
+CREATE_BACKOFF_SECONDS = 1.0
+
+# Errors a create/start may raise. docker-py only wraps HTTP errors in
+# APIError; dropped connections and timeouts surface as requests exceptions.
+_CREATE_ERRORS = (
+    docker.errors.DockerException,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Decide whether a failed Docker create/start is worth retrying.
+
+    Daemon-side (5xx) errors, rate limiting, dropped connections and
+    timeouts are transient. Client errors such as a missing image or an
+    invalid configuration will fail the same way again.
+
+    Args:
+        error: Exception raised by the Docker SDK
+
+    Returns:
+        True if the operation should be retried
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, docker.errors.APIError):
+        return error.is_server_error() or error.status_code == 429
+    return False
+
 
 class ContainerPool:
     """
@@ -31,34 +68,75 @@ class ContainerPool:
 
     Lifecycle:
     1. Initialize pool with N ready containers at startup
-    2. Allocate container to session on request (pop from ready pool)
-    3. Spawn replacement container in background (non-blocking)
-    4. Stop and track container when session ends
+    2. Allocate container to session on request (oldest ready container first)
+    3. Top the pool back up to target size in background (non-blocking)
+    4. Stop and track container when session ends, or recycle it for a
+       later session when config.release_strategy is pause or keep_alive
     5. Cleanup old stopped containers (future Phase 7)
     """
 
-    def __init__(self, docker_client: docker.DockerClient, config: ContainerPoolConfig):
+    def __init__(
+        self,
+        docker_client: docker.DockerClient,
+        config: ContainerPoolConfig,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize the container pool.
 
         Args:
             docker_client: Docker client instance
             config: Container pool configuration
+            max_workers: Threads for blocking Docker calls. Should cover one
+                release per concurrent session plus a full replenish;
+                defaults to the default max_concurrent_sessions plus
+                config.size.
         """
         self.docker_client = docker_client
         self.config = config
 
+        # Invariant creation parameters, validated once; only the name and
+        # labels differ between containers
+        self._container_template = build_container_config_template(
+            config=config.security,
+            image=config.image,
+        )
+
         # Pool state
-        self.ready_pool: List[Container] = []
+        self.ready_pool: Deque[Container] = deque()
+        self.paused_pool: Deque[Container] = deque()
         self.active_sessions: Dict[str, Container] = {}
-        self.stopped_containers: List[Tuple[Container, datetime]] = []
+        # Stop times are time.monotonic() seconds, for TTL comparisons.
+        # Bounded so that a long-running pool does not accumulate records
+        # forever; _total_stopped keeps the lifetime count.
+        self.stopped_containers: Deque[Tuple[Container, float]] = deque(maxlen=config.forensics_max)
+        self._total_stopped = 0
 
         # Synchronization and control
         self._lock = asyncio.Lock()
         self._shutdown = False
 
+        # Containers being created by a background replenish; counted
+        # towards the target so bursts of allocations do not over-spawn
+        self._in_flight = 0
+        self._replenish_tasks: Set[asyncio.Task] = set()
+
+        # Blocking Docker calls run on their own threads so they neither
+        # queue behind nor starve the loop's default executor. A burst of
+        # releases (each stop waits out the grace period) must not leave
+        # allocations and replenishment queued behind it.
+        if max_workers is None:
+            max_workers = ServerConfig.model_fields["max_concurrent_sessions"].default + config.size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hermes-docker"
+        )
+
+        # Bounds concurrent create+start calls so warm-up bursts do not flood
+        # the Docker daemon or occupy every executor thread
+        self._create_sem = asyncio.Semaphore(config.create_concurrency)
+
         logger.info(
-            f"Container pool initialized (target size: {config.size}, image: {config.image})"
+            "Container pool initialized (target size: %d, image: %s)", config.size, config.image
         )
 
     async def initialize(self) -> None:
@@ -71,8 +149,8 @@ class ContainerPool:
         Raises:
             RuntimeError: If any container fails to create
         """
-        logger.info(f"Initializing container pool with {self.config.size} containers...")
-        start_time = datetime.utcnow()
+        logger.info("Initializing container pool with %d containers...", self.config.size)
+        start_time = time.monotonic()
 
         try:
             # Create containers in parallel for faster startup
@@ -83,14 +161,15 @@ class ContainerPool:
             async with self._lock:
                 self.ready_pool.extend(containers)
 
-            elapsed = (datetime.utcnow() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             logger.info(
-                f"Container pool initialized successfully in {elapsed:.2f}s "
-                f"({self.config.size} containers ready)"
+                "Container pool initialized successfully in %.2fs (%d containers ready)",
+                elapsed,
+                self.config.size,
             )
 
         except Exception as e:
-            logger.error(f"Failed to initialize container pool: {e}", exc_info=True)
+            logger.error("Failed to initialize container pool: %s", e, exc_info=True)
             # Cleanup any partially created containers
             await self._cleanup_ready_containers()
             raise RuntimeError(f"Container pool initialization failed: {e}") from e
@@ -99,9 +178,11 @@ class ContainerPool:
         """
         Allocate a container to a session.
 
-        Pops a container from the ready pool and assigns it to the session.
-        If pool is empty, creates a container on-demand. Spawns a replacement
-        container in the background to maintain pool size.
+        Pops a container from the ready pool and assigns it to the session,
+        falling back to unpausing a recycled container from the paused pool.
+        If both are empty, creates a container on-demand. Schedules a single
+        background replenish for whatever the pool is short of its target,
+        counting creations already in flight.
 
         Args:
             session_id: Unique identifier for the session
@@ -112,37 +193,55 @@ class ContainerPool:
         Raises:
             RuntimeError: If container allocation fails
         """
-        async with self._lock:
-            # Try to get container from ready pool
-            if self.ready_pool:
-                container = self.ready_pool.pop()
-                logger.debug(f"Allocated container from pool: {container.id[:12]}")
-            else:
-                # Pool empty - create on demand (should be rare)
-                logger.warning(f"Container pool empty! Creating on-demand for session {session_id}")
-                try:
-                    container = await self._create_container_sync()
-                except Exception as e:
-                    logger.error(f"Failed to create on-demand container: {e}", exc_info=True)
-                    raise RuntimeError(f"Container allocation failed: {e}") from e
-
-            # Update container labels with session ID
-            try:
-                container.reload()  # Refresh container info
-                # Note: Can't modify labels on running container, just track in our state
-            except Exception as e:
-                logger.warning(f"Failed to reload container info: {e}")
-
-            # Track in active sessions
-            self.active_sessions[session_id] = container
-
-        # Spawn replacement in background (non-blocking)
-        asyncio.create_task(self._spawn_replacement())
+        failed: List[Container] = []
+        try:
+            async with self._lock:
+                # Try to get container from ready pool
+                if self.ready_pool:
+                    # FIFO: hand out the longest-warmed container first
+                    container = self.ready_pool.popleft()
+                    logger.debug("Allocated container from pool: %.12s", container.id)
+                else:
+                    container = await self._unpause_recycled(failed)
 
-        logger.info(
-            f"Container {container.id[:12]} allocated to session {session_id} "
-            f"(pool size: {len(self.ready_pool)}, active: {len(self.active_sessions)})"
-        )
+                if container is None:
+                    # Pool empty - create on demand (should be rare)
+                    logger.warning(
+                        "Container pool empty! Creating on-demand for session %s", session_id
+                    )
+                    try:
+                        container = await self._create_container_sync()
+                    except Exception as e:
+                        logger.error("Failed to create on-demand container: %s", e, exc_info=True)
+                        raise RuntimeError(f"Container allocation failed: {e}") from e
+
+                # Track in active sessions. Labels can't be changed on a running
+                # container, so the session mapping lives only in our state.
+                self.active_sessions[session_id] = container
+
+                # Reserve the deficit now so concurrent allocations don't also claim it
+                need = max(0, self.config.size - self._available_count())
+                self._in_flight += need
+        finally:
+            # Containers that failed to unpause are stopped outside the lock
+            # so their stop grace period does not hold up other callers
+            if failed:
+                await self._stop_containers(failed)
+
+        # Replenish in background (non-blocking)
+        if need:
+            task = asyncio.create_task(self._replenish(need))
+            self._replenish_tasks.add(task)
+            task.add_done_callback(self._replenish_tasks.discard)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Container %.12s allocated to session %s (pool size: %d, active: %d)",
+                container.id,
+                session_id,
+                len(self.ready_pool),
+                len(self.active_sessions),
+            )
 
         return container
 
@@ -150,9 +249,10 @@ class ContainerPool:
         """
         Release a container from a session.
 
-        Stops the container (preserving disk state for forensics) and removes
-        it from active sessions. The stopped container is tracked with a
-        timestamp for future cleanup.
+        Removes the container from active sessions, then either recycles it
+        (see config.release_strategy) or stops it, preserving disk state for
+        forensics. A stopped container is tracked with a timestamp for
+        future cleanup.
 
         Args:
             session_id: Session identifier to release
@@ -161,59 +261,156 @@ class ContainerPool:
             KeyError: If session_id is not in active sessions
         """
         async with self._lock:
-            if session_id not in self.active_sessions:
-                logger.warning(f"Attempted to release unknown session: {session_id}")
-                return
+            container = self.active_sessions.pop(session_id, None)
 
-            container = self.active_sessions.pop(session_id)
+        if container is None:
+            logger.warning("Attempted to release unknown session: %s", session_id)
+            return
+
+        if self.config.release_strategy != "stop" and await self._recycle(container):
+            logger.info(
+                "Container %.12s recycled from session %s (%s)",
+                container.id,
+                session_id,
+                self.config.release_strategy,
+            )
+            return
 
         # Stop container (outside lock to prevent blocking)
         try:
-            logger.debug(f"Stopping container {container.id[:12]} for session {session_id}")
-            await asyncio.get_event_loop().run_in_executor(None, container.stop)
+            logger.debug("Stopping container %.12s for session %s", container.id, session_id)
+            await asyncio.get_running_loop().run_in_executor(self._executor, container.stop)
 
             # Track stopped container with timestamp
             async with self._lock:
-                self.stopped_containers.append((container, datetime.utcnow()))
+                self._track_stopped(container, time.monotonic())
 
             logger.info(
-                f"Container {container.id[:12]} released from session {session_id} "
-                f"(stopped containers: {len(self.stopped_containers)})"
+                "Container %.12s released from session %s (stopped containers: %d)",
+                container.id,
+                session_id,
+                len(self.stopped_containers),
             )
 
         except Exception as e:
-            logger.error(f"Failed to stop container {container.id[:12]}: {e}", exc_info=True)
+            logger.error("Failed to stop container %.12s: %s", container.id, e, exc_info=True)
             # Still remove from active sessions even if stop failed
             # Container will be in inconsistent state but won't block pool
 
+    async def _recycle(self, container: Container) -> bool:
+        """
+        Prepare a released container for reuse by a later session.
+
+        With the pause strategy the container is paused and parked in the
+        paused pool; with keep_alive config.reset_command is run inside it
+        and it goes back on the ready pool. A container is only recycled while
+        fewer than config.size containers are idle or being created, so a
+        background replenish and recycling cannot together overshoot the
+        target.
+
+        Args:
+            container: Container released by its session
+
+        Returns:
+            True if the container was recycled, False if it should be
+            stopped instead
+        """
+        async with self._lock:
+            if self._shutdown or self._available_count() >= self.config.size:
+                return False
+
+        loop = asyncio.get_running_loop()
+        try:
+            if self.config.release_strategy == "pause":
+                await loop.run_in_executor(self._executor, container.pause)
+            else:
+                result = await loop.run_in_executor(
+                    self._executor, container.exec_run, self.config.reset_command
+                )
+                if result.exit_code != 0:
+                    logger.warning(
+                        "Reset of container %.12s exited with %d, stopping it instead",
+                        container.id,
+                        result.exit_code,
+                    )
+                    return False
+        except Exception as e:
+            logger.warning("Failed to recycle container %.12s: %s", container.id, e)
+            return False
+
+        async with self._lock:
+            if self._shutdown or self._available_count() >= self.config.size:
+                return False
+            if self.config.release_strategy == "pause":
+                self.paused_pool.append(container)
+            else:
+                self.ready_pool.append(container)
+        return True
+
+    def _idle_count(self) -> int:
+        """Count containers waiting for a session (ready or paused)."""
+        return len(self.ready_pool) + len(self.paused_pool)
+
+    def _available_count(self) -> int:
+        """Count idle containers plus creations in flight."""
+        return self._idle_count() + self._in_flight
+
+    async def _unpause_recycled(self, failed: List[Container]) -> Optional[Container]:
+        """
+        Take a container from the paused pool and unpause it.
+
+        Must be called with the pool lock held. Containers that fail to
+        unpause are appended to ``failed`` for the caller to stop once the
+        lock is released, and the next one is tried.
+
+        Args:
+            failed: Receives containers that could not be unpaused
+
+        Returns:
+            Running container, or None if the paused pool is exhausted
+        """
+        loop = asyncio.get_running_loop()
+        while self.paused_pool:
+            container = self.paused_pool.popleft()
+            try:
+                await loop.run_in_executor(self._executor, container.unpause)
+            except Exception as e:
+                logger.warning("Failed to unpause container %.12s: %s", container.id, e)
+                failed.append(container)
+                continue
+            logger.debug("Allocated container from paused pool: %.12s", container.id)
+            return container
+        return None
+
     async def shutdown(self) -> None:
         """
         Shutdown the container pool.
 
-        Stops all active and ready containers. Does not remove stopped
-        containers (preserved for forensics).
+        Stops all active and ready containers, waits for background
+        replenishment to finish (it stops whatever it created), then shuts
+        down the Docker executor. Does not remove stopped containers
+        (preserved for forensics).
         """
         logger.info("Shutting down container pool...")
         self._shutdown = True
 
         async with self._lock:
-            # Stop all active containers
-            for session_id, container in list(self.active_sessions.items()):
-                try:
-                    logger.debug(f"Stopping active container {container.id[:12]}")
-                    await asyncio.get_event_loop().run_in_executor(None, container.stop)
-                    self.stopped_containers.append((container, datetime.utcnow()))
-                except Exception as e:
-                    logger.error(f"Failed to stop container {container.id[:12]}: {e}")
-
+            # Stop all active and ready containers concurrently
+            containers = list(self.active_sessions.values())
             self.active_sessions.clear()
+            containers.extend(self.ready_pool)
+            self.ready_pool.clear()
+            containers.extend(self.paused_pool)
+            self.paused_pool.clear()
+            await self._stop_containers(containers)
 
-            # Stop all ready containers
-            await self._cleanup_ready_containers()
+        if self._replenish_tasks:
+            await asyncio.gather(*self._replenish_tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
 
         logger.info(
-            f"Container pool shutdown complete "
-            f"(stopped containers preserved: {len(self.stopped_containers)})"
+            "Container pool shutdown complete (stopped containers preserved: %d)",
+            len(self.stopped_containers),
         )
 
     async def _create_container_sync(self) -> Container:
@@ -221,107 +418,127 @@ class ContainerPool:
         Create and start a new container synchronously (for asyncio.gather).
 
         This is a wrapper around _create_container that runs the synchronous
-        Docker operations in an executor.
+        Docker operations in an executor, with at most
+        config.create_concurrency creations in flight at once. Transient
+        Docker errors are retried up to CREATE_ATTEMPTS times with
+        exponential backoff; the backoff sleeps on the event loop without
+        holding an executor thread or a creation slot.
 
         Returns:
             Started container
 
         Raises:
-            RuntimeError: If container creation fails after retry
+            RuntimeError: If container creation fails permanently or after
+                the final retry
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._create_container)
+        loop = asyncio.get_running_loop()
+        for attempt in range(CREATE_ATTEMPTS):
+            try:
+                async with self._create_sem:
+                    return await loop.run_in_executor(self._executor, self._create_container)
+            except _CREATE_ERRORS as e:
+                if not _is_transient(e) or attempt == CREATE_ATTEMPTS - 1:
+                    logger.error(
+                        "Container creation failed after %d attempt(s): %s",
+                        attempt + 1,
+                        e,
+                        exc_info=True,
+                    )
+                    raise RuntimeError(f"Failed to create container: {e}") from e
+
+                delay = CREATE_BACKOFF_SECONDS * 2**attempt
+                logger.warning("Container creation failed, retrying in %.1fs: %s", delay, e)
+                await asyncio.sleep(delay)
+        # Only reached when CREATE_ATTEMPTS is zero
+        raise RuntimeError("Failed to create container: no attempts made")
 
     def _create_container(self) -> Container:
         """
         Create and start a new container (synchronous Docker operations).
 
         Builds container config, creates container via Docker API, and starts it.
-        Implements retry logic with single retry on failure.
+        Each call uses a fresh container name, so a retry never collides with
+        a container left behind by a failed attempt.
 
         Returns:
             Started container
-
-        Raises:
-            RuntimeError: If container creation fails after retry
         """
         name = self._generate_container_name()
 
-        try:
-            # Build container config with security constraints
-            container_config = build_container_config(
-                config=self.config.security,
-                image=self.config.image,
-                name=name,
-            )
-
-            logger.debug(f"Creating container: {name}")
-
-            # Create container (doesn't start it yet)
-            container = self.docker_client.containers.create(**container_config)
-
-            # Start container
-            container.start()
-
-            logger.debug(f"Container created and started: {container.id[:12]} ({name})")
-            return container
+        # Build container config with security constraints
+        container_config = build_container_config(
+            config=self.config.security,
+            image=self.config.image,
+            name=name,
+            template=self._container_template,
+        )
 
-        except docker.errors.DockerException as e:
-            logger.warning(f"Container creation failed, retrying: {e}")
+        logger.debug("Creating container: %s", name)
 
-            # Single retry with delay
-            import time
+        # Create container (doesn't start it yet)
+        container = self.docker_client.containers.create(**container_config)
 
-            time.sleep(2)
+        # Start container
+        container.start()
 
-            try:
-                container = self.docker_client.containers.create(**container_config)
-                container.start()
-                logger.info(f"Container created successfully on retry: {container.id[:12]}")
-                return container
-            except docker.errors.DockerException as retry_error:
-                logger.error(
-                    f"Container creation failed after retry: {retry_error}",
-                    exc_info=True,
-                )
-                raise RuntimeError(
-                    f"Failed to create container after retry: {retry_error}"
-                ) from retry_error
+        logger.debug("Container created and started: %.12s (%s)", container.id, name)
+        return container
 
-    async def _spawn_replacement(self) -> None:
+    async def _replenish(self, need: int) -> None:
         """
-        Spawn a replacement container in the background.
+        Create containers in the background to bring the pool back to size.
 
-        This is a non-blocking task that adds a container to the ready pool
-        to maintain target pool size. Errors are logged but not raised.
-        """
-        if self._shutdown:
-            return
+        Creates ``need`` containers concurrently (bounded by the create
+        semaphore) and adds them to the ready pool in one lock acquisition.
+        The caller must already have added ``need`` to ``_in_flight``.
+        Errors are logged but not raised.
 
+        Args:
+            need: Number of containers to create
+        """
         try:
-            container = await self._create_container_sync()
+            if self._shutdown:
+                return
+
+            results = await asyncio.gather(
+                *(self._create_container_sync() for _ in range(need)), return_exceptions=True
+            )
+            containers = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error("Failed to spawn replacement container: %s", result)
+                else:
+                    containers.append(result)
 
             async with self._lock:
                 if not self._shutdown:
-                    self.ready_pool.append(container)
+                    self.ready_pool.extend(containers)
                     logger.debug(
-                        f"Replacement container spawned: {container.id[:12]} "
-                        f"(pool size: {len(self.ready_pool)})"
+                        "Spawned %d replacement container(s) (pool size: %d)",
+                        len(containers),
+                        len(self.ready_pool),
                     )
-                else:
-                    # Shutdown during spawn - stop the container
-                    await asyncio.get_event_loop().run_in_executor(None, container.stop, 10)
+                    return
+
+            # Shutdown during spawn - stop the containers
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(self._executor, c.stop, 10) for c in containers),
+                return_exceptions=True,
+            )
 
         except Exception as e:
-            logger.error(f"Failed to spawn replacement container: {e}", exc_info=True)
+            logger.error("Failed to replenish container pool: %s", e, exc_info=True)
             # Don't raise - this is a background task
+        finally:
+            self._in_flight -= need
 
     def _generate_container_name(self, session_id: Optional[str] = None) -> str:
         """
         Generate a unique container name.
 
         Format: hermes-target-{id}-{timestamp}
-        Where id is first 8 chars of session_id or random UUID
+        Where id is first 8 chars of session_id or 8 random hex chars
 
         Args:
             session_id: Optional session ID to include in name
@@ -332,40 +549,97 @@ class ContainerPool:
         if session_id:
             id_part = session_id[:8]
         else:
-            id_part = str(uuid.uuid4())[:8]
+            id_part = secrets.token_hex(4)
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
         return f"hermes-target-{id_part}-{timestamp}"
 
     async def _cleanup_ready_containers(self) -> None:
         """
         Cleanup all containers in the ready pool.
 
-        Stops all ready containers and moves them to stopped_containers list.
-        Called during shutdown.
+        Stops all ready containers and tracks them in stopped_containers.
+        Called when pool initialization fails.
         """
-        for container in self.ready_pool:
-            try:
-                logger.debug(f"Stopping ready container {container.id[:12]}")
-                await asyncio.get_event_loop().run_in_executor(None, container.stop)
-                self.stopped_containers.append((container, datetime.utcnow()))
-            except Exception as e:
-                logger.error(f"Failed to stop container {container.id[:12]}: {e}")
-
+        containers = list(self.ready_pool)
         self.ready_pool.clear()
+        await self._stop_containers(containers)
 
-    def get_stats(self) -> Dict[str, int]:
+    async def _stop_containers(self, containers: List[Container]) -> None:
+        """
+        Stop containers concurrently and track them as stopped.
+
+        Stopping N containers takes about as long as the slowest stop rather
+        than the sum of all of them. Failures are logged per container and
+        the failed containers are not tracked.
+
+        Args:
+            containers: Containers to stop
+        """
+        loop = asyncio.get_running_loop()
+
+        async def stop_one(container: Container) -> float:
+            logger.debug("Stopping container %.12s", container.id)
+            await loop.run_in_executor(self._executor, container.stop)
+            return time.monotonic()
+
+        results = await asyncio.gather(
+            *(stop_one(container) for container in containers), return_exceptions=True
+        )
+        for container, result in zip(containers, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Failed to stop container %.12s: %s", container.id, result)
+            else:
+                self._track_stopped(container, result)
+
+    def _track_stopped(self, container: Container, stopped_at: float) -> None:
+        """
+        Record a stopped container for forensics.
+
+        Records older than config.cleanup_stopped_after_days are dropped,
+        and once config.forensics_max records are held the oldest one is
+        evicted to make room. Only the in-memory record goes away; the
+        container itself stays on the Docker host.
+
+        Args:
+            container: Container that was stopped
+            stopped_at: time.monotonic() timestamp of the stop
+        """
+        stopped = self.stopped_containers
+        ttl_days = self.config.cleanup_stopped_after_days
+        if ttl_days:
+            cutoff = stopped_at - ttl_days * 86400
+            while stopped and stopped[0][1] < cutoff:
+                stopped.popleft()
+        if len(stopped) == stopped.maxlen:
+            logger.debug(
+                "Forensics record limit (%d) reached, dropping oldest record", stopped.maxlen
+            )
+        stopped.append((container, stopped_at))
+        self._total_stopped += 1
+
+    async def get_stats(self) -> Dict[str, int]:
         """
         Get current pool statistics.
 
+        The counts are read under the pool lock, so they form a consistent
+        snapshot rather than racing an allocate or release.
+
         Returns:
-            Dictionary with pool stats (ready, active, stopped counts)
+            Dictionary with pool stats (ready, paused, active and tracked
+            stopped counts, plus the lifetime number of stopped containers)
         """
+        async with self._lock:
+            ready = len(self.ready_pool)
+            paused = len(self.paused_pool)
+            active = len(self.active_sessions)
+            stopped = len(self.stopped_containers)
+            stopped_total = self._total_stopped
         return {
-            "ready": len(self.ready_pool),
-            "active": len(self.active_sessions),
-            "stopped": len(self.stopped_containers),
-            "total": len(self.ready_pool)
-            + len(self.active_sessions)
-            + len(self.stopped_containers),
+            "ready": ready,
+            "paused": paused,
+            "active": active,
+            "stopped": stopped,
+            "total": ready + paused + active + stopped,
+            "stopped_total": stopped_total,
         }
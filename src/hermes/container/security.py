@@ -14,28 +14,28 @@ from hermes.config import ContainerSecurityConfig
 
 logger = logging.getLogger(__name__)
 
+# Docker accepts: <number>[k|m|g] (case-insensitive)
+_MEMORY_LIMIT_RE = re.compile(r"^\d+[kmgKMG]$")
 
-def build_container_config(
+
+def build_container_config_template(
     config: ContainerSecurityConfig,
     image: str,
-    name: str,
-    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    Build Docker container creation parameters with security constraints.
+    Build the container creation parameters shared by every container.
 
-    This function converts the high-level security configuration into
-    Docker API parameters, applying all necessary security constraints
-    for container isolation and resource limits.
+    Validates the security configuration and converts it into Docker API
+    parameters once, so that per-container calls to build_container_config()
+    only add the name and labels.
 
     Args:
         config: Security configuration from main config
         image: Docker image name (e.g., 'hermes-target-ubuntu:latest')
-        name: Container name
-        session_id: Optional session ID for labeling
 
     Returns:
-        Dictionary of parameters for docker.containers.create()
+        Dictionary of parameters for docker.containers.create(), without
+        name and labels
 
     Raises:
         ValueError: If configuration values are invalid
@@ -55,24 +55,18 @@ def build_container_config(
     cpu_period = 100000
 
     logger.debug(
-        f"Building container config: memory={config.memory_limit}, "
-        f"cpu_quota={cpu_quota}/{cpu_period} ({config.cpu_quota} cores), "
-        f"pids={config.pids_limit}, network={config.network_mode}"
+        "Building container config: memory=%s, cpu_quota=%d/%d (%s cores), pids=%d, network=%s",
+        config.memory_limit,
+        cpu_quota,
+        cpu_period,
+        config.cpu_quota,
+        config.pids_limit,
+        config.network_mode,
     )
 
-    # Build labels for tracking and identification
-    labels = {
-        "hermes.role": "target",
-        "hermes.version": "mvp",
-        "hermes.created": datetime.utcnow().isoformat(),
-    }
-    if session_id:
-        labels["hermes.session_id"] = session_id
-
     # Build complete container configuration
-    container_config = {
+    template = {
         "image": image,
-        "name": name,
         "detach": True,
         "stdin_open": True,  # Keep stdin open for docker exec
         "tty": False,  # TTY is handled by exec, not container startup
@@ -89,23 +83,56 @@ def build_container_config(
         "security_opt": config.security_opt,
         "cap_drop": config.capabilities.drop,
         "cap_add": config.capabilities.add,
-        # Labels for identification
-        "labels": labels,
     }
 
-    # Log warnings for unusual configurations
-    if config.cpu_quota > 2.0:
-        logger.warning(
-            f"High CPU quota configured: {config.cpu_quota} cores. "
-            f"Consider reducing to prevent resource exhaustion."
-        )
+    # Unusual CPU/PID settings are warned about when the config is validated
 
-    if config.pids_limit < 50:
-        logger.warning(
-            f"Very low PIDs limit: {config.pids_limit}. "
-            f"Container may fail to spawn necessary processes."
-        )
+    return template
+
+
+def build_container_config(
+    config: ContainerSecurityConfig,
+    image: str,
+    name: str,
+    session_id: Optional[str] = None,
+    template: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build Docker container creation parameters with security constraints.
+
+    This function converts the high-level security configuration into
+    Docker API parameters, applying all necessary security constraints
+    for container isolation and resource limits.
+
+    Args:
+        config: Security configuration from main config
+        image: Docker image name (e.g., 'hermes-target-ubuntu:latest')
+        name: Container name
+        session_id: Optional session ID for labeling
+        template: Optional result of build_container_config_template() for
+            the same config and image, reused instead of rebuilding it
+
+    Returns:
+        Dictionary of parameters for docker.containers.create()
+
+    Raises:
+        ValueError: If configuration values are invalid
+    """
+    if template is None:
+        template = build_container_config_template(config, image)
+
+    # Build labels for tracking and identification
+    labels = {
+        "hermes.role": "target",
+        "hermes.version": "mvp",
+        "hermes.created": datetime.utcnow().isoformat(),
+    }
+    if session_id:
+        labels["hermes.session_id"] = session_id
 
+    container_config = dict(template)
+    container_config["name"] = name
+    container_config["labels"] = labels
     return container_config
 
 
@@ -119,9 +146,7 @@ def _is_valid_memory_limit(limit: str) -> bool:
     Returns:
         True if format is valid, False otherwise
     """
-    # Docker accepts: <number>[k|m|g] (case-insensitive)
-    pattern = r"^\d+[kmgKMG]$"
-    return bool(re.match(pattern, limit))
+    return _MEMORY_LIMIT_RE.match(limit) is not None
 
 
 def parse_memory_limit(limit: str) -> int:
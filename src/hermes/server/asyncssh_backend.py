@@ -5,10 +5,12 @@ This module implements the SSH server using the asyncssh library.
 """
 
 import asyncio
+import functools
 import logging
-import uuid
+import secrets
+import weakref
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, MutableMapping, Optional
 
 import asyncssh
 
@@ -19,6 +21,18 @@ from hermes.server.backend import PTYRequest, SSHBackend, SessionInfo
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_host_key(path: str, mtime_ns: int) -> asyncssh.SSHKey:
+    """
+    Read and parse an SSH host key.
+
+    Cached by path and modification time so that restarting the server, or
+    forking workers after the first load, reuses the parsed key while a
+    replaced key file is read again.
+    """
+    return asyncssh.read_private_key(path)
+
+
 class HermesSSHServer(asyncssh.SSHServer):
     """
     AsyncSSH server implementation for Hermes.
@@ -54,7 +68,8 @@ class HermesSSHServer(asyncssh.SSHServer):
         Args:
             conn: SSH server connection
         """
-        self.connection_id = str(uuid.uuid4())
+        # 64 random bits: plenty for an opaque session key and log token
+        self.connection_id = secrets.token_hex(8)
         self.conn = conn  # Store connection reference
         peername = conn.get_extra_info("peername")
         source_ip = peername[0] if peername else "unknown"
@@ -71,11 +86,13 @@ class HermesSSHServer(asyncssh.SSHServer):
 
         # Store session info in backend for session factory access
         if self._backend:
-            self._backend._session_info_map[self.connection_id] = self.session_info
+            self._backend._session_info_map[conn] = self.session_info
 
         logger.info(
-            f"New SSH connection from {source_ip}:{source_port} "
-            f"(connection_id: {self.connection_id})"
+            "New SSH connection from %s:%s (connection_id: %s)",
+            source_ip,
+            source_port,
+            self.connection_id,
         )
 
     def connection_lost(self, exc: Optional[Exception]) -> None:
@@ -86,10 +103,10 @@ class HermesSSHServer(asyncssh.SSHServer):
             exc: Exception that caused disconnection, if any
         """
         if self.connection_id:
-            logger.info(
-                f"Connection closed: {self.connection_id} "
-                f"({'error: ' + str(exc) if exc else 'normal'})"
-            )
+            if exc:
+                logger.info("Connection closed: %s (error: %s)", self.connection_id, exc)
+            else:
+                logger.info("Connection closed: %s (normal)", self.connection_id)
             self.auth_manager.cleanup_connection(self.connection_id)
 
     def password_auth_supported(self) -> bool:
@@ -108,7 +125,7 @@ class HermesSSHServer(asyncssh.SSHServer):
         """
         if self.session_info:
             self.session_info.username = username
-        logger.debug(f"Begin auth for user: {username} (connection: {self.connection_id})")
+        logger.debug("Begin auth for user: %s (connection: %s)", username, self.connection_id)
         return True
 
     def validate_password(self, username: str, password: str) -> bool:
@@ -144,19 +161,28 @@ class AsyncSSHBackend(SSHBackend):
     Uses the asyncssh library to provide SSH server functionality.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, reuse_port: bool = False):
         """
         Initialize the AsyncSSH backend.
 
         Args:
             config: Hermes configuration
+            reuse_port: Bind with SO_REUSEPORT so several worker processes
+                can share the listening port
         """
         super().__init__(config)
+        self.reuse_port = reuse_port
         self.auth_manager = AuthenticationManager(config.authentication)
         self.session_handler: Optional[Callable] = None
         self.container_pool = None  # Will be set by set_container_pool()
         self._server: Optional[asyncssh.SSHListener] = None
-        self._session_info_map: Dict[str, SessionInfo] = {}  # Store session info by connection
+        # Session info by connection; entries go away with their connection
+        self._session_info_map: MutableMapping[asyncssh.SSHServerConnection, SessionInfo] = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Caps sessions (and so containers) in use at once
+        self._session_sem = asyncio.Semaphore(config.server.max_concurrent_sessions)
 
         logger.info("AsyncSSH backend initialized")
 
@@ -178,25 +204,29 @@ class AsyncSSHBackend(SSHBackend):
                 f"Generate one with: ssh-keygen -t rsa -f {host_key_path} -N ''"
             )
 
-        logger.info(f"Starting SSH server on {host}:{port}")
-        logger.info(f"Using host key: {host_key_path}")
+        logger.info("Starting SSH server on %s:%s", host, port)
+        logger.info("Using host key: %s", host_key_path)
 
         try:
+            host_key = _load_host_key(str(host_key_path), host_key_path.stat().st_mtime_ns)
             self._server = await asyncssh.listen(
                 host=host,
                 port=port,
-                server_host_keys=[str(host_key_path)],
-                server_factory=lambda: HermesSSHServer(
-                    self.auth_manager, self.session_handler, self
+                server_host_keys=[host_key],
+                # Bound once; invoked for every accepted connection
+                server_factory=functools.partial(
+                    HermesSSHServer, self.auth_manager, self.session_handler, self
                 ),
                 process_factory=self._process_factory,
                 encoding=None,  # Handle binary data
+                reuse_address=True,
+                reuse_port=self.reuse_port,
             )
 
-            logger.info(f"SSH server started successfully on {host}:{port}")
+            logger.info("SSH server started successfully on %s:%s", host, port)
 
         except Exception as e:
-            logger.error(f"Failed to start SSH server: {e}", exc_info=True)
+            logger.error("Failed to start SSH server: %s", e, exc_info=True)
             raise RuntimeError(f"Failed to start SSH server: {e}") from e
 
     async def stop(self) -> None:
@@ -249,7 +279,8 @@ class AsyncSSHBackend(SSHBackend):
         Factory function invoked for each new SSH session.
 
         Extracts PTY info and session metadata from the process object,
-        then delegates to the registered session handler.
+        then delegates to the registered session handler. Sessions beyond
+        config.server.max_concurrent_sessions are rejected.
 
         Args:
             process: SSHServerProcess with stdin/stdout/stderr streams
@@ -261,16 +292,13 @@ class AsyncSSHBackend(SSHBackend):
             process.exit(1)
             return
 
-        # Find session info from our map
-        if not self._session_info_map:
-            logger.error("No session info available in map")
+        # Find session info registered by connection_made for this connection
+        session_info = self._session_info_map.get(conn)
+        if session_info is None:
+            logger.error("No session info available for connection")
             process.exit(1)
             return
 
-        # Match by connection - use the most recent entry
-        # (session_factory/process_factory is called right after connection_made)
-        session_info = list(self._session_info_map.values())[-1]
-
         # Extract PTY info from the process
         term_type = process.get_terminal_type() or "xterm"
         term_size = process.get_terminal_size()
@@ -288,8 +316,11 @@ class AsyncSSHBackend(SSHBackend):
         )
 
         logger.info(
-            f"Process factory: session {session_info.session_id}, "
-            f"term={term_type}, size={width}x{height}"
+            "Process factory: session %s, term=%s, size=%dx%d",
+            session_info.session_id,
+            term_type,
+            width,
+            height,
         )
 
         if not self.session_handler:
@@ -297,11 +328,23 @@ class AsyncSSHBackend(SSHBackend):
             process.exit(1)
             return
 
+        if self._session_sem.locked():
+            logger.warning(
+                "Max concurrent sessions (%d) reached, rejecting session %s",
+                self.config.server.max_concurrent_sessions,
+                session_info.session_id,
+            )
+            process.exit(1)
+            return
+
         try:
-            await self.session_handler(session_info, pty_request, process)
+            async with self._session_sem:
+                await self.session_handler(session_info, pty_request, process)
         except Exception as e:
             logger.error(
-                f"Session handler error (session: {session_info.session_id}): {e}",
+                "Session handler error (session: %s): %s",
+                session_info.session_id,
+                e,
                 exc_info=True,
             )
         finally:
@@ -5,13 +5,20 @@ Handles validation of credentials against configured static credentials
 and implements accept-all mode after N failed attempts.
 """
 
+import hmac
 import logging
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Tuple
 
 from hermes.config import AuthenticationConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on connections tracked for failed attempts. Scanners that open
+# connections and never finish authenticating would otherwise grow the map
+# without limit; the least recently failed connection is evicted first.
+MAX_TRACKED_CONNECTIONS = 10_000
+
 
 class AuthenticationManager:
     """
@@ -28,17 +35,32 @@ class AuthenticationManager:
             config: Authentication configuration
         """
         self.config = config
-        self._failed_attempts: Dict[str, int] = {}
+        self._failed_attempts: OrderedDict[str, int] = OrderedDict()
+        self._accept_all_threshold = config.accept_all_after_failures
+        self._accept_all_enabled = config.accept_all_after_failures > 0
 
         # Build credential lookup for performance
         self._credentials: Dict[str, str] = {
             cred.username: cred.password for cred in config.static_credentials
         }
 
-        logger.info(f"Loaded {len(self._credentials)} static credentials")
+        # Combined (username, password) set so a valid login is a single hash probe.
+        # Built from the dict so duplicate usernames keep last-wins semantics.
+        self._credential_pairs: FrozenSet[Tuple[str, str]] = frozenset(self._credentials.items())
+
+        # Encoded copy for constant-time comparison on the failure path
+        self._credentials_bytes: Dict[bytes, bytes] = {
+            username.encode(): password.encode() for username, password in self._credentials.items()
+        }
+
+        # Compared against on unknown usernames so both rejection paths do the same work
+        self._dummy_password = b"x" * 32
+
+        logger.info("Loaded %d static credentials", len(self._credentials))
         logger.info(
-            f"Accept-all mode after {config.accept_all_after_failures} failures "
-            f"({'disabled' if config.accept_all_after_failures == 0 else 'enabled'})"
+            "Accept-all mode after %d failures (%s)",
+            config.accept_all_after_failures,
+            "enabled" if self._accept_all_enabled else "disabled",
         )
 
     def validate(self, connection_id: str, username: str, password: str) -> bool:
@@ -53,24 +75,30 @@ class AuthenticationManager:
         Returns:
             True if authentication successful, False otherwise
         """
-        # Check if accept-all mode is active for this connection
-        if self._should_accept_all(connection_id):
-            logger.info(f"Accept-all mode active for {connection_id} (username: {username})")
+        # Check if accept-all mode is active for this connection. The flag test
+        # skips the method call entirely in the common disabled configuration.
+        if self._accept_all_enabled and self._should_accept_all(connection_id):
+            logger.info("Accept-all mode active for %s (username: %s)", connection_id, username)
             self._reset_failures(connection_id)
             return True
 
         # Check static credentials
-        if username in self._credentials:
-            if self._credentials[username] == password:
-                logger.info(f"Valid credentials for {username} from {connection_id}")
-                self._reset_failures(connection_id)
-                return True
-
-        # Authentication failed
-        self._increment_failures(connection_id)
+        if (username, password) in self._credential_pairs:
+            logger.info("Valid credentials for %s from %s", username, connection_id)
+            self._reset_failures(connection_id)
+            return True
+
+        # Authentication failed. Run a constant-time compare against the stored
+        # password (or a dummy for unknown usernames) so that wrong-password and
+        # unknown-user rejections take the same time. compare_digest iterates over
+        # the supplied password whatever the stored length, so a fixed-size dummy
+        # does not leak which usernames exist.
+        stored = self._credentials_bytes.get(username.encode(), self._dummy_password)
+        hmac.compare_digest(stored, password.encode())
+
+        attempts = self._increment_failures(connection_id)
         logger.warning(
-            f"Invalid credentials for {username} from {connection_id} "
-            f"(attempt {self._failed_attempts.get(connection_id, 0)})"
+            "Invalid credentials for %s from %s (attempt %d)", username, connection_id, attempts
         )
         return False
 
@@ -84,20 +112,34 @@ class AuthenticationManager:
         Returns:
             True if accept-all mode should be used
         """
-        if self.config.accept_all_after_failures == 0:
+        if not self._accept_all_enabled:
             return False
 
-        failures = self._failed_attempts.get(connection_id, 0)
-        return failures >= self.config.accept_all_after_failures
+        # .get() rather than [] so probing never inserts entries for unknown connections
+        return self._failed_attempts.get(connection_id, 0) >= self._accept_all_threshold
+
+    def _increment_failures(self, connection_id: str) -> int:
+        """
+        Increment failed attempt counter for a connection.
 
-    def _increment_failures(self, connection_id: str) -> None:
-        """Increment failed attempt counter for a connection."""
-        self._failed_attempts[connection_id] = self._failed_attempts.get(connection_id, 0) + 1
+        Evicts the least recently failed connection once more than
+        MAX_TRACKED_CONNECTIONS are being tracked.
+
+        Returns:
+            Updated failure count for the connection
+        """
+        failed = self._failed_attempts
+        # pop + reinsert reads the old count and moves the key to the most
+        # recently failed end in two operations, with no separate move_to_end
+        count = failed.pop(connection_id, 0) + 1
+        failed[connection_id] = count
+        if len(failed) > MAX_TRACKED_CONNECTIONS:
+            failed.popitem(last=False)
+        return count
 
     def _reset_failures(self, connection_id: str) -> None:
         """Reset failed attempt counter for a connection."""
-        if connection_id in self._failed_attempts:
-            del self._failed_attempts[connection_id]
+        self._failed_attempts.pop(connection_id, None)
 
     def cleanup_connection(self, connection_id: str) -> None:
         """
@@ -12,7 +12,7 @@ from typing import Any, Callable, Optional
 from hermes.config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about an SSH session."""
 
@@ -24,7 +24,7 @@ class SessionInfo:
     failed_attempts: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PTYRequest:
     """Pseudo-terminal request details."""
 
@@ -14,6 +14,9 @@ from hermes.server.backend import PTYRequest
 
 logger = logging.getLogger(__name__)
 
+# Maximum bytes moved per read in either direction
+_MAX_BATCH = 65536
+
 
 class ContainerProxy:
     """
@@ -58,7 +61,12 @@ class ContainerProxy:
         self.container_to_ssh_task: Optional[asyncio.Task] = None
 
         self._running = False
-        self._shutdown_event = asyncio.Event()
+
+        # Reusable receive buffer for container output; avoids allocating a new
+        # bytes object per read. asyncssh copies written data, so slices of it
+        # are safe to hand to stdout.write.
+        self._recv_buf = bytearray(_MAX_BATCH)
+        self._recv_view = memoryview(self._recv_buf)
 
     async def start(self) -> None:
         """
@@ -73,8 +81,9 @@ class ContainerProxy:
             RuntimeError: If exec creation fails
         """
         logger.info(
-            f"Starting container proxy for session {self.session_id} "
-            f"(container: {self.container.id[:12]})"
+            "Starting container proxy for session %s (container: %s)",
+            self.session_id,
+            self.container.id[:12],
         )
 
         try:
@@ -104,14 +113,18 @@ class ContainerProxy:
             self.exec_socket.setblocking(False)
 
             logger.debug(
-                f"Docker exec created for session {self.session_id} "
-                f"(term: {self.pty_request.term_type}, "
-                f"size: {self.pty_request.width}x{self.pty_request.height})"
+                "Docker exec created for session %s (term: %s, size: %dx%d)",
+                self.session_id,
+                self.pty_request.term_type,
+                self.pty_request.width,
+                self.pty_request.height,
             )
 
         except Exception as e:
             logger.error(
-                f"Failed to create Docker exec for session {self.session_id}: {e}",
+                "Failed to create Docker exec for session %s: %s",
+                self.session_id,
+                e,
                 exc_info=True,
             )
             raise RuntimeError(f"Docker exec creation failed: {e}") from e
@@ -121,7 +134,7 @@ class ContainerProxy:
         self.ssh_to_container_task = asyncio.create_task(self._ssh_to_container())
         self.container_to_ssh_task = asyncio.create_task(self._container_to_ssh())
 
-        logger.info(f"Container proxy started for session {self.session_id}")
+        logger.info("Container proxy started for session %s", self.session_id)
 
     async def _ssh_to_container(self) -> None:
         """
@@ -130,44 +143,48 @@ class ContainerProxy:
         Runs until:
         - SSH connection closes (stdin returns empty)
         - Error occurs
-        - Shutdown event is set
+        - Proxy is stopped
         """
-        logger.debug(f"SSH→Container task started (session: {self.session_id})")
-        loop = asyncio.get_event_loop()
+        logger.debug("SSH→Container task started (session: %s)", self.session_id)
+        loop = asyncio.get_running_loop()
 
         try:
+            # Bind hot-loop lookups once; they do not change for the session
+            stdin_read = self.process.stdin.read
+            sock_sendall = loop.sock_sendall
+            sock = self.exec_socket
+            record_input = self.recorder.record_input if self.recorder else None
+
             while self._running:
-                # Read from SSH stdin
-                data = await self.process.stdin.read(4096)
+                # Read from SSH stdin. asyncssh returns whatever is buffered (up to the
+                # limit) without waiting for a full chunk, so a large limit lets pasted
+                # payloads go to the container in one send.
+                data = await stdin_read(_MAX_BATCH)
 
                 if not data:
                     # SSH client disconnected
-                    logger.info(f"SSH client disconnected (session: {self.session_id})")
+                    logger.info("SSH client disconnected (session: %s)", self.session_id)
                     break
 
-                if self.recorder:
-                    self.recorder.record_input(data)
+                if record_input is not None:
+                    record_input(data)
 
-                # Write to container exec socket
-                try:
-                    await loop.sock_sendall(self.exec_socket, data)
-                except BlockingIOError:
-                    # Retry after small delay
-                    await asyncio.sleep(0.01)
-                    await loop.sock_sendall(self.exec_socket, data)
+                # Write to container exec socket (awaits writability via the selector)
+                await sock_sendall(sock, data)
 
         except ConnectionResetError:
-            logger.info(f"SSH connection reset (session: {self.session_id})")
+            logger.info("SSH connection reset (session: %s)", self.session_id)
         except BrokenPipeError:
-            logger.info(f"Container exec closed (session: {self.session_id})")
+            logger.info("Container exec closed (session: %s)", self.session_id)
         except Exception as e:
             logger.error(
-                f"Error in SSH→Container forwarding (session: {self.session_id}): {e}",
+                "Error in SSH→Container forwarding (session: %s): %s",
+                self.session_id,
+                e,
                 exc_info=True,
             )
         finally:
-            self._shutdown_event.set()
-            logger.debug(f"SSH→Container task ended (session: {self.session_id})")
+            logger.debug("SSH→Container task ended (session: %s)", self.session_id)
 
     async def _container_to_ssh(self) -> None:
         """
@@ -176,45 +193,56 @@ class ContainerProxy:
         Runs until:
         - Container exec ends (socket returns empty)
         - Error occurs
-        - Shutdown event is set
+        - Proxy is stopped
         """
-        logger.debug(f"Container→SSH task started (session: {self.session_id})")
-        loop = asyncio.get_event_loop()
+        logger.debug("Container→SSH task started (session: %s)", self.session_id)
+        loop = asyncio.get_running_loop()
 
         try:
+            # Bind hot-loop lookups once; they do not change for the session
+            sock_recv_into = loop.sock_recv_into
+            sock = self.exec_socket
+            recv_buf = self._recv_buf
+            recv_view = self._recv_view
+            stdout_write = self.process.stdout.write
+            stdout_drain = self.process.stdout.drain
+            record_output = self.recorder.record_output if self.recorder else None
+
             while self._running:
-                # Read from container exec socket
-                try:
-                    data = await loop.sock_recv(self.exec_socket, 4096)
-                except BlockingIOError:
-                    # No data available, retry after small delay
-                    await asyncio.sleep(0.01)
-                    continue
+                # Read from container exec socket (awaits readability via the selector).
+                # A 64 KiB read picks up all queued output (e.g. `cat bigfile`) at once,
+                # so asyncssh sees one write + drain instead of many.
+                nbytes = await sock_recv_into(sock, recv_buf)
 
-                if not data:
+                if not nbytes:
                     # Container exec ended
-                    logger.info(f"Container exec ended (session: {self.session_id})")
+                    logger.info("Container exec ended (session: %s)", self.session_id)
                     break
 
-                if self.recorder:
-                    self.recorder.record_output(data)
+                # View into the reused buffer; only valid until the next read
+                data = recv_view[:nbytes]
+
+                if record_output is not None:
+                    record_output(data)
 
-                # Write to SSH stdout
-                self.process.stdout.write(data)
-                await self.process.stdout.drain()
+                # Write to SSH stdout. asyncssh encrypts channel data in userspace, so
+                # kernel zero-copy (splice/sendfile) into the transport is not possible.
+                stdout_write(data)
+                await stdout_drain()
 
         except ConnectionResetError:
-            logger.info(f"Container connection reset (session: {self.session_id})")
+            logger.info("Container connection reset (session: %s)", self.session_id)
         except BrokenPipeError:
-            logger.info(f"SSH client disconnected (session: {self.session_id})")
+            logger.info("SSH client disconnected (session: %s)", self.session_id)
         except Exception as e:
             logger.error(
-                f"Error in Container→SSH forwarding (session: {self.session_id}): {e}",
+                "Error in Container→SSH forwarding (session: %s): %s",
+                self.session_id,
+                e,
                 exc_info=True,
             )
         finally:
-            self._shutdown_event.set()
-            logger.debug(f"Container→SSH task ended (session: {self.session_id})")
+            logger.debug("Container→SSH task ended (session: %s)", self.session_id)
 
     async def handle_resize(self, width: int, height: int) -> None:
         """
@@ -230,8 +258,11 @@ class ContainerProxy:
             Most use cases work fine with initial terminal size.
         """
         logger.debug(
-            f"Terminal resize to {width}x{height} (session: {self.session_id}) - "
-            f"not forwarded to container (known limitation)"
+            "Terminal resize to %dx%d (session: %s) - "
+            "not forwarded to container (known limitation)",
+            width,
+            height,
+            self.session_id,
         )
         if self.recorder:
             self.recorder.record_resize(width, height)
@@ -240,10 +271,17 @@ class ContainerProxy:
         """
         Wait for proxy to complete.
 
-        Returns when either I/O task exits or shutdown event is set.
+        Returns as soon as either I/O task exits. Returns immediately if
+        the proxy was never started.
         """
-        # Wait for shutdown event
-        await self._shutdown_event.wait()
+        tasks = {
+            task
+            for task in (self.ssh_to_container_task, self.container_to_ssh_task)
+            if task is not None
+        }
+        if not tasks:
+            return
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
 
     async def stop(self) -> None:
         """
@@ -254,7 +292,7 @@ class ContainerProxy:
         if not self._running:
             return
 
-        logger.info(f"Stopping container proxy (session: {self.session_id})")
+        logger.info("Stopping container proxy (session: %s)", self.session_id)
         self._running = False
 
         # Cancel tasks if still running
@@ -277,6 +315,6 @@ class ContainerProxy:
             try:
                 self.exec_socket.close()
             except Exception as e:
-                logger.warning(f"Error closing exec socket (session: {self.session_id}): {e}")
+                logger.warning("Error closing exec socket (session: %s): %s", self.session_id, e)
 
-        logger.info(f"Container proxy stopped (session: {self.session_id})")
+        logger.info("Container proxy stopped (session: %s)", self.session_id)
@@ -1,23 +1,76 @@
 """Session recording in asciicast v2 format."""
 
+import asyncio
 import json
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, List, Optional
 
 from hermes.config import RecordingConfig
 
 logger = logging.getLogger(__name__)
 
+# Shared compact encoder for the header. json.dumps() builds a new
+# JSONEncoder on every call whenever non-default options such as separators
+# are passed.
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# Events always have the shape [time, "<type>", "<data>"], so lines are
+# assembled directly around the C string escaper instead of going through
+# the general encoder. Output matches _encode() apart from the time, which
+# always carries six decimals.
+_EVENT_CODES = {"o": b'"o"', "i": b'"i"', "r": b'"r"'}
+
+# Events are collected in memory and handed to the writer thread once this
+# much has accumulated, or at the latest _FLUSH_INTERVAL seconds after being
+# recorded
+_WRITE_BUFFER_SIZE = 64 * 1024
+_FLUSH_INTERVAL = 0.25
+
+# Upper bound on the bytes a single recording may have pending or queued for
+# the writer thread. Events recorded beyond it are dropped and counted, so a
+# stalled disk costs bounded memory instead of growing without limit.
+_MAX_QUEUED_SIZE = 1024 * 1024
+
+# All recordings share one writer thread: a live session costs no OS thread
+# of its own, and each file's batches are written in submission order.
+_writer: Optional[ThreadPoolExecutor] = None
+
+
+def _get_writer() -> ThreadPoolExecutor:
+    """Return the shared recording writer, creating it on first use."""
+    global _writer
+    if _writer is None:
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hermes-recorder")
+    return _writer
+
+
+def _event_line(elapsed_ns: int, event_type: str, text: str) -> bytes:
+    """Format one asciicast event as a newline-terminated JSON line."""
+    seconds, ns = divmod(elapsed_ns, 1_000_000_000)
+    return b"[%d.%06d,%s,%s]\n" % (
+        seconds,
+        ns // 1000,
+        _EVENT_CODES[event_type],
+        encode_basestring_ascii(text).encode("ascii"),
+    )
+
 
 class SessionRecorder:
     """
     Records SSH session I/O to asciicast v2 .cast files.
 
-    Writes are streamed to disk immediately (no full-session buffering).
-    All public methods catch exceptions internally — recording failure
-    never propagates to the caller.
+    Recording an event only formats it into an in-memory batch. Batches are
+    written to disk by a writer thread shared by all recordings when they
+    fill up, shortly after each burst of events (when running inside an
+    event loop), and on stop(), so a slow disk never blocks the event loop.
+    At most _MAX_QUEUED_SIZE bytes are held per recording; further events
+    are dropped and counted. All public methods catch exceptions
+    internally — recording failure never propagates to the caller.
     """
 
     def __init__(
@@ -33,8 +86,17 @@ class SessionRecorder:
         self._width = width
         self._height = height
         self._metadata = metadata or {}
-        self._file = None
-        self._start_time: float = 0.0
+        self._file: Optional[BinaryIO] = None
+        self._pending: List[bytes] = []
+        self._pending_size: int = 0
+        # Bytes handed to the writer thread but not yet written; updated
+        # from both threads, so guarded by _queued_lock
+        self._queued_size: int = 0
+        self._queued_lock = threading.Lock()
+        self._dropped_events: int = 0
+        self._write_failed = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._start_ns: int = 0
         self._event_count: int = 0
 
     @property
@@ -50,8 +112,8 @@ class SessionRecorder:
             output_dir = Path(self._config.output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
             path = output_dir / f"{self._session_id}.cast"
-            self._file = open(path, "w", encoding="utf-8")
-            self._start_time = time.monotonic()
+            self._file = open(path, "wb")
+            self._start_ns = time.monotonic_ns()
             header = {
                 "version": 2,
                 "width": self._width,
@@ -60,13 +122,11 @@ class SessionRecorder:
             }
             if self._metadata:
                 header["env"] = self._metadata
-            self._file.write(json.dumps(header, separators=(",", ":")) + "\n")
-            self._file.flush()
+            self._pending.append(_encode(header).encode() + b"\n")
+            self.flush()
             logger.info("Recording started: %s", path)
         except Exception:
-            logger.exception(
-                "Failed to start recording for %s", self._session_id
-            )
+            logger.exception("Failed to start recording for %s", self._session_id)
             self._file = None
 
     def record_output(self, data: bytes) -> None:
@@ -79,42 +139,66 @@ class SessionRecorder:
 
     def record_resize(self, width: int, height: int) -> None:
         """Record terminal resize event."""
+        self._emit("r", f"{width}x{height}")
+
+    def flush(self) -> None:
+        """Hand recorded events to the writer thread without waiting for the write."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._file or not self._pending:
+            return
+        batch, size = self._pending, self._pending_size
+        self._pending = []
+        self._pending_size = 0
+        if self._write_failed:
+            # The writer hit an I/O error; close the recording so later
+            # events short-circuit on the inactive check
+            self._close_file(self._file)
+            return
+        try:
+            with self._queued_lock:
+                self._queued_size += size
+            _get_writer().submit(self._write_batch, self._file, batch, size)
+        except Exception:
+            logger.warning(
+                "Failed to flush recording for %s",
+                self._session_id,
+                exc_info=True,
+            )
+
+    async def stop(self) -> None:
+        """
+        Flush and close recording file. Safe to call multiple times.
+
+        Awaits this recording's outstanding writes without blocking the event
+        loop, so the .cast file is complete when stop() returns.
+        """
         if not self._file:
             return
+        self.flush()
+        if not self._file:
+            # flush() already closed the file after a failed write
+            return
         try:
-            elapsed = time.monotonic() - self._start_time
-            line = json.dumps(
-                [round(elapsed, 6), "r", f"{width}x{height}"],
-                separators=(",", ":"),
+            await asyncio.wrap_future(self._close_file(self._file))
+            logger.info(
+                "Recording stopped for %s: %d events, %d dropped",
+                self._session_id,
+                self._event_count,
+                self._dropped_events,
             )
-            self._file.write(line + "\n")
-            self._file.flush()
-            self._event_count += 1
         except Exception:
             logger.warning(
-                "Failed to record resize for %s",
+                "Error closing recording for %s",
                 self._session_id,
                 exc_info=True,
             )
 
-    def stop(self) -> None:
-        """Close recording file. Safe to call multiple times."""
-        if self._file:
-            try:
-                self._file.close()
-                logger.info(
-                    "Recording stopped for %s: %d events",
-                    self._session_id,
-                    self._event_count,
-                )
-            except Exception:
-                logger.warning(
-                    "Error closing recording for %s",
-                    self._session_id,
-                    exc_info=True,
-                )
-            finally:
-                self._file = None
+    def _close_file(self, file: BinaryIO) -> "Future[None]":
+        """Detach the .cast file and close it on the writer thread after queued writes."""
+        self._file = None
+        return _get_writer().submit(file.close)
 
     def write_metadata(self) -> None:
         """Write JSON metadata sidecar file."""
@@ -132,19 +216,20 @@ class SessionRecorder:
             )
 
     def _record_event(self, event_type: str, data: bytes) -> None:
-        """Write a single event line to the .cast file."""
+        """Decode a data event and queue it for the .cast file."""
+        if not self._file:
+            return
+        # str() accepts any bytes-like object, so memoryviews into the
+        # proxy's reused receive buffer are decoded without a copy
+        self._emit(event_type, str(data, "utf-8", errors="replace"))
+
+    def _emit(self, event_type: str, payload: str) -> None:
+        """Queue a single event line for the .cast file."""
         if not self._file:
             return
         try:
-            elapsed = time.monotonic() - self._start_time
-            text = data.decode("utf-8", errors="replace")
-            line = json.dumps(
-                [round(elapsed, 6), event_type, text],
-                separators=(",", ":"),
-            )
-            self._file.write(line + "\n")
-            self._file.flush()
-            self._event_count += 1
+            elapsed_ns = time.monotonic_ns() - self._start_ns
+            self._append(_event_line(elapsed_ns, event_type, payload))
         except Exception:
             logger.warning(
                 "Failed to record %s event for %s",
@@ -152,3 +237,50 @@ class SessionRecorder:
                 self._session_id,
                 exc_info=True,
             )
+
+    def _append(self, line: bytes) -> None:
+        """Add a formatted event to the pending batch, flushing when it is full."""
+        if self._pending_size + self._queued_size + len(line) > _MAX_QUEUED_SIZE:
+            if not self._dropped_events:
+                logger.warning(
+                    "Recording for %s is falling behind, dropping events",
+                    self._session_id,
+                )
+            self._dropped_events += 1
+            return
+        self._pending.append(line)
+        self._pending_size += len(line)
+        self._event_count += 1
+        if self._pending_size >= _WRITE_BUFFER_SIZE:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Arrange for pending events to be flushed after _FLUSH_INTERVAL."""
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not inside an event loop; events are flushed when the batch fills or on stop()
+            return
+        self._flush_handle = loop.call_later(_FLUSH_INTERVAL, self.flush)
+
+    def _write_batch(self, file: BinaryIO, batch: List[bytes], size: int) -> None:
+        """Write a batch of lines to the .cast file (runs on the writer thread)."""
+        try:
+            if self._write_failed:
+                return
+            file.write(b"".join(batch))
+            file.flush()
+        except OSError:
+            self._write_failed = True
+            logger.warning(
+                "Failed to write recording for %s, dropping further events",
+                self._session_id,
+                exc_info=True,
+            )
+        finally:
+            with self._queued_lock:
+                self._queued_size -= size
@@ -0,0 +1,65 @@
+"""
+Shared fixtures for Hermes integration tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+FULL_CONFIG_YAML = """server:
+  host: "192.168.1.10"
+  port: 22
+  max_concurrent_sessions: 50
+  session_timeout: 7200
+
+authentication:
+  static_credentials:
+    - username: "root"
+      password: "toor"
+  accept_all_after_failures: 10
+
+container_pool:
+  size: 10
+  image: "honeypot:latest"
+  spawn_timeout: 60
+  max_session_duration: 1800
+  security:
+    memory_limit: "1g"
+    cpu_quota: 2.0
+    pids_limit: 500
+
+recording:
+  enabled: true
+  format: "asciinema"
+
+logging:
+  level: "DEBUG"
+  format: "text"
+
+docker:
+  base_url: "tcp://docker:2375"
+"""
+
+MINIMAL_CONFIG_YAML = "server:\n  port: 3333\n"
+
+
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory) -> Path:
+    """Directory holding the YAML fixture files, written once per session."""
+    return tmp_path_factory.mktemp("config")
+
+
+@pytest.fixture(scope="session")
+def full_config_path(config_dir: Path) -> Path:
+    """Config file that sets a value in every section."""
+    path = config_dir / "full_config.yaml"
+    path.write_text(FULL_CONFIG_YAML)
+    return path
+
+
+@pytest.fixture(scope="session")
+def minimal_config_path(config_dir: Path) -> Path:
+    """Config file that overrides only the server port."""
+    path = config_dir / "minimal.yaml"
+    path.write_text(MINIMAL_CONFIG_YAML)
+    return path
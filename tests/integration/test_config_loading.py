@@ -7,6 +7,7 @@ Tests YAML file → Config object → component initialization flow.
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from hermes.config import Config
 from hermes.container.security import build_container_config
@@ -104,44 +105,8 @@ container_pool:
 class TestConfigFullYaml:
     """Test loading a comprehensive YAML configuration."""
 
-    def test_full_config_loads_all_sections(self, tmp_path: Path):
-        config_file = tmp_path / "full_config.yaml"
-        config_file.write_text("""
-server:
-  host: "192.168.1.10"
-  port: 22
-  max_concurrent_sessions: 50
-  session_timeout: 7200
-
-authentication:
-  static_credentials:
-    - username: "root"
-      password: "toor"
-  accept_all_after_failures: 10
-
-container_pool:
-  size: 10
-  image: "honeypot:latest"
-  spawn_timeout: 60
-  max_session_duration: 1800
-  security:
-    memory_limit: "1g"
-    cpu_quota: 2.0
-    pids_limit: 500
-
-recording:
-  enabled: true
-  format: "asciinema"
-
-logging:
-  level: "DEBUG"
-  format: "text"
-
-docker:
-  base_url: "tcp://docker:2375"
-""")
-
-        config = Config.from_file(config_file)
+    def test_full_config_loads_all_sections(self, full_config_path: Path):
+        config = Config.from_file(full_config_path)
 
         assert config.server.host == "192.168.1.10"
         assert config.server.port == 22
@@ -154,12 +119,9 @@ docker:
         assert config.logging.level == "DEBUG"
         assert config.docker.base_url == "tcp://docker:2375"
 
-    def test_minimal_config_uses_defaults(self, tmp_path: Path):
+    def test_minimal_config_uses_defaults(self, minimal_config_path: Path):
         """A minimal config file should fill in all defaults."""
-        config_file = tmp_path / "minimal.yaml"
-        config_file.write_text("server:\n  port: 3333\n")
-
-        config = Config.from_file(config_file)
+        config = Config.from_file(minimal_config_path)
 
         assert config.server.port == 3333
         assert config.server.host == "0.0.0.0"  # default
@@ -171,20 +133,21 @@ docker:
 class TestConfigValidationErrors:
     """Test that invalid configurations are rejected."""
 
-    def test_invalid_port_rejected(self, tmp_path: Path):
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("server:\n  port: 99999\n")
-        with pytest.raises(Exception):
-            Config.from_file(config_file)
-
-    def test_negative_pool_size_rejected(self, tmp_path: Path):
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("container_pool:\n  size: -1\n")
-        with pytest.raises(Exception):
-            Config.from_file(config_file)
-
-    def test_cpu_quota_too_high_rejected(self, tmp_path: Path):
+    @pytest.mark.parametrize(
+        ("yaml_text", "field"),
+        [
+            ("server:\n  port: 99999\n", ("server", "port")),
+            ("container_pool:\n  size: -1\n", ("container_pool", "size")),
+            (
+                "container_pool:\n  security:\n    cpu_quota: 100.0\n",
+                ("container_pool", "security", "cpu_quota"),
+            ),
+        ],
+        ids=["port", "pool_size", "cpu_quota"],
+    )
+    def test_invalid_value_rejected(self, tmp_path: Path, yaml_text: str, field: tuple):
         config_file = tmp_path / "config.yaml"
-        config_file.write_text("container_pool:\n  security:\n    cpu_quota: 100.0\n")
-        with pytest.raises(Exception):
+        config_file.write_text(yaml_text)
+        with pytest.raises(ValidationError) as exc_info:
             Config.from_file(config_file)
+        assert exc_info.value.errors()[0]["loc"] == field
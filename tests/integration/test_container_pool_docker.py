@@ -13,7 +13,9 @@ test runs. If running multiple times rapidly, clean up Docker containers first:
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Set
 
 import docker
 import pytest
@@ -35,17 +37,59 @@ def docker_client() -> docker.DockerClient:
 
 @pytest.fixture(scope="session")
 def target_image(docker_client: docker.DockerClient) -> str:
-    """Ensure the target image exists."""
+    """Ensure the target image exists and warm it up once for the session."""
     image_name = "hermes-target-ubuntu:latest"
     try:
         docker_client.images.get(image_name)
-        return image_name
     except docker.errors.ImageNotFound:
         pytest.skip(
             f"Image {image_name} not found. "
             f"Build with: docker build -f docker/Dockerfile -t {image_name} docker/"
         )
 
+    # Run one throwaway container so the first test's spawn does not also pay
+    # for loading the image layers; spawn_timeout then only measures the pool
+    try:
+        docker_client.containers.run(
+            image_name, entrypoint=["true"], network_mode="none", remove=True
+        )
+    except docker.errors.DockerException:
+        pass
+    return image_name
+
+
+_TARGET_LABEL = "hermes.role=target"
+
+
+def _running_ids(client: docker.DockerClient) -> Set[str]:
+    """Return the ids of all running containers in a single API call."""
+    return {c.id for c in client.containers.list()}
+
+
+def _remove_hermes_containers(client: docker.DockerClient) -> None:
+    """
+    Remove every hermes target container.
+
+    Stopped containers go in one prune call filtered on the role label that
+    build_container_config() sets; the few still running are force-removed
+    concurrently rather than one round-trip after another.
+    """
+    try:
+        client.containers.prune(filters={"label": _TARGET_LABEL})
+        running = client.containers.list(filters={"label": _TARGET_LABEL})
+    except Exception:
+        return
+
+    def remove(container) -> None:
+        try:
+            container.remove(force=True)
+        except Exception:
+            pass
+
+    if running:
+        with ThreadPoolExecutor(max_workers=len(running)) as executor:
+            list(executor.map(remove, running))
+
 
 @pytest.mark.docker
 class TestContainerPoolRealDocker:
@@ -66,48 +110,36 @@ class TestContainerPoolRealDocker:
         config.security.security_opt = ["no-new-privileges:true"]
         return config
 
-    @pytest.fixture
-    async def pool(
-        self, docker_client: docker.DockerClient, pool_config: ContainerPoolConfig, request
-    ):
-        """Create and cleanup a real container pool."""
-        import time
-        import uuid
-
-        # Use unique suffix to avoid naming conflicts
-        test_id = f"{request.node.name}-{uuid.uuid4().hex[:8]}"
-
-        # Pre-cleanup: remove any containers
-        def cleanup_containers():
-            try:
-                containers = docker_client.containers.list(
-                    all=True,
-                    filters={"name": "hermes-target-"},
-                )
-                for c in containers:
-                    try:
-                        c.remove(force=True)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-
-        cleanup_containers()
-
-        # Small delay to ensure cleanup is complete
-        await asyncio.sleep(0.5)
+    @pytest.fixture(scope="class", autouse=True)
+    def clean_containers(self, docker_client: docker.DockerClient):
+        """Remove leftover hermes containers once before and after the class."""
+        _remove_hermes_containers(docker_client)
+        yield
+        _remove_hermes_containers(docker_client)
 
+    @pytest.fixture
+    async def pool(self, docker_client: docker.DockerClient, pool_config: ContainerPoolConfig):
+        """Create a real container pool and shut it down after the test."""
         pool = ContainerPool(docker_client, pool_config)
         yield pool
 
-        # Cleanup: shutdown the pool
         try:
             await pool.shutdown()
         except Exception:
             pass
 
-        # Remove any leftover containers
-        cleanup_containers()
+    @pytest.fixture
+    async def concurrent_pool(
+        self, docker_client: docker.DockerClient, pool_config: ContainerPoolConfig
+    ):
+        """Pool with one ready container per concurrent allocation."""
+        pool = ContainerPool(docker_client, pool_config.model_copy(update={"size": 2}))
+        yield pool
+
+        try:
+            await pool.shutdown()
+        except Exception:
+            pass
 
     @pytest.mark.asyncio
     async def test_initialize_creates_real_containers(
@@ -120,8 +152,9 @@ class TestContainerPoolRealDocker:
         containers = pool.ready_pool
 
         # Verify containers actually exist in Docker
+        running_ids = _running_ids(docker_client)
         for c in containers:
-            assert c.id in [c.id for c in docker_client.containers.list()]
+            assert c.id in running_ids
             # Reload to get fresh status
             c.reload()
             assert c.status == "running"
@@ -135,11 +168,9 @@ class TestContainerPoolRealDocker:
 
         container = await pool.allocate("test-session-001")
 
-        # Verify it's a real Docker container
-        assert container.id in [c.id for c in docker_client.containers.list()]
-        assert container.status == "running"
-
-        # Verify we can inspect it
+        # Verify it's a real Docker container. The attrs cached by create()
+        # predate start(), so one reload is needed to see the live status.
+        assert container.id in _running_ids(docker_client)
         container.reload()
         assert container.status == "running"
 
@@ -165,33 +196,30 @@ class TestContainerPoolRealDocker:
         """When pool is empty, allocate creates container on-demand."""
         await pool.initialize()
 
-        # Drain the ready pool
-        for i in range(2):
-            await pool.allocate(f"session-{i}")
-
-        # Wait for any background spawning
-        await asyncio.sleep(0.5)
-
-        # Clear ready pool to force on-demand
+        # Empty the ready pool directly rather than draining it through
+        # allocations, stopping what was taken so nothing is left running
+        drained = list(pool.ready_pool)
         pool.ready_pool.clear()
+        await pool._stop_containers(drained)
 
         # This allocation should create on-demand
         container = await pool.allocate("session-on-demand")
 
         assert container is not None
         assert container.status == "running"
-        assert container.id in [c.id for c in docker_client.containers.list()]
+        assert container.id in _running_ids(docker_client)
 
     @pytest.mark.asyncio
     async def test_concurrent_allocations_with_real_containers(
-        self, pool: ContainerPool
+        self, concurrent_pool: ContainerPool
     ):
         """Multiple concurrent allocations work with real containers."""
-        await pool.initialize()
+        await concurrent_pool.initialize()
 
-        # Allocate all at once
-        tasks = [pool.allocate(f"concurrent-{i}") for i in range(2)]
-        results = await asyncio.gather(*tasks)
+        # Allocate all at once; both are served from the pre-warmed ready pool
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(concurrent_pool.allocate(f"concurrent-{i}")) for i in range(2)]
+        results = [task.result() for task in tasks]
 
         assert len(results) == 2
         assert all(c.status == "running" for c in results)
@@ -226,7 +254,7 @@ class TestContainerPoolRealDocker:
         """Complete lifecycle: init → allocate → use → release → shutdown."""
         # Initialize
         await pool.initialize()
-        pool_size = pool.get_stats()["ready"]
+        pool_size = (await pool.get_stats())["ready"]
         assert pool_size == 1  # pool_config.size is 1
 
         # Allocate all
@@ -235,27 +263,27 @@ class TestContainerPoolRealDocker:
             c = await pool.allocate(f"lifecycle-{i}")
             containers.append(c)
 
-        assert pool.get_stats()["active"] == pool_size
-        assert pool.get_stats()["ready"] == 0
+        assert (await pool.get_stats())["active"] == pool_size
+        assert (await pool.get_stats())["ready"] == 0
 
         # Verify all running
-        running = docker_client.containers.list()
+        running_ids = _running_ids(docker_client)
         for c in containers:
-            assert c.id in [rc.id for rc in running]
+            assert c.id in running_ids
 
         # Release all
         for i in range(pool_size):
             await pool.release(f"lifecycle-{i}")
 
-        assert pool.get_stats()["active"] == 0
-        assert pool.get_stats()["stopped"] >= pool_size
+        assert (await pool.get_stats())["active"] == 0
+        assert (await pool.get_stats())["stopped"] >= pool_size
 
         # Shutdown
         await pool.shutdown()
         assert pool._shutdown is True
 
         # All should be stopped
-        for container in containers:
-            docker_container = docker_client.containers.get(container.id)
-            docker_container.reload()
-            assert docker_container.status == "exited"
+        exited_ids = {
+            c.id for c in docker_client.containers.list(all=True, filters={"status": "exited"})
+        }
+        assert {c.id for c in containers} <= exited_ids
@@ -58,7 +58,7 @@ class TestPoolInitializeAndAllocate:
         await pool.initialize()
 
         assert len(pool.ready_pool) == 3
-        assert pool.get_stats()["ready"] == 3
+        assert (await pool.get_stats())["ready"] == 3
 
         # Allocate all 3
         containers = []
@@ -66,15 +66,15 @@ class TestPoolInitializeAndAllocate:
             c = await pool.allocate(f"session-{i}")
             containers.append(c)
 
-        assert pool.get_stats()["active"] == 3
-        assert pool.get_stats()["ready"] == 0
+        assert (await pool.get_stats())["active"] == 3
+        assert (await pool.get_stats())["ready"] == 0
 
         # Release all 3
         for i in range(3):
             await pool.release(f"session-{i}")
 
-        assert pool.get_stats()["active"] == 0
-        assert pool.get_stats()["stopped"] == 3
+        assert (await pool.get_stats())["active"] == 0
+        assert (await pool.get_stats())["stopped"] == 3
 
         # All containers had .stop() called
         for c in containers:
@@ -94,8 +94,8 @@ class TestPoolInitializeAndAllocate:
         for i in range(3):
             await pool.allocate(f"s-{i}")
 
-        # Clear replacement tasks
-        await asyncio.sleep(0.05)
+        # Let background replenishment finish
+        await asyncio.gather(*pool._replenish_tasks)
 
         # Pool is now empty; next allocate should create on-demand
         # (replacement spawns happen in background too)
@@ -119,7 +119,7 @@ class TestPoolInitializeAndAllocate:
 
         # 1 released + 2 from shutdown = 3 stopped
         # Plus replacement containers that may have spawned
-        assert pool.get_stats()["stopped"] >= 3
+        assert (await pool.get_stats())["stopped"] >= 3
 
 
 class TestPoolConcurrentAllocations:
@@ -138,7 +138,7 @@ class TestPoolConcurrentAllocations:
         results = await asyncio.gather(*tasks)
 
         assert len(results) == 5
-        assert pool.get_stats()["active"] == 5
+        assert (await pool.get_stats())["active"] == 5
 
         # All should be unique containers
         container_ids = [c.id for c in results]
@@ -158,8 +158,8 @@ class TestPoolConcurrentAllocations:
         tasks = [pool.release(f"s-{i}") for i in range(3)]
         await asyncio.gather(*tasks)
 
-        assert pool.get_stats()["active"] == 0
-        assert pool.get_stats()["stopped"] == 3
+        assert (await pool.get_stats())["active"] == 0
+        assert (await pool.get_stats())["stopped"] == 3
 
 
 class TestPoolErrorRecovery:
@@ -181,7 +181,7 @@ class TestPoolErrorRecovery:
         assert "s1" not in pool.active_sessions
 
         # Pool still works for new allocations
-        await asyncio.sleep(0.05)
+        await asyncio.gather(*pool._replenish_tasks)
         c2 = await pool.allocate("s2")
         assert c2 is not None
 
@@ -196,7 +196,7 @@ class TestPoolErrorRecovery:
         with pytest.raises(RuntimeError):
             await pool.initialize()
 
-        assert pool.ready_pool == []
+        assert len(pool.ready_pool) == 0
         assert pool.active_sessions == {}
 
     @pytest.mark.asyncio
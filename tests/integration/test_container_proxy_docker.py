@@ -202,7 +202,7 @@ class TestContainerProxyRealDocker:
             pass
 
         await proxy.stop()
-        recorder.stop()
+        await recorder.stop()
 
         # Verify recording was created
         cast_file = tmp_path / "recordings" / "test-001.cast"
@@ -186,7 +186,7 @@ class TestFullSessionWithRealDocker:
             pass
         finally:
             await proxy.stop()
-            recorder.stop()
+            await recorder.stop()
             recorder.write_metadata()
             await container_pool.release("session-rec-001")
 
@@ -223,7 +223,7 @@ class TestFullSessionWithRealDocker:
                 containers.append((session_id, container))
 
             # Verify both are active
-            assert container_pool.get_stats()["active"] == 2
+            assert (await container_pool.get_stats())["active"] == 2
 
             # Authenticate both
             for i in range(2):
@@ -236,8 +236,8 @@ class TestFullSessionWithRealDocker:
             for session_id, _ in containers:
                 await container_pool.release(session_id)
 
-            assert container_pool.get_stats()["active"] == 0
-            assert container_pool.get_stats()["stopped"] == 2
+            assert (await container_pool.get_stats())["active"] == 0
+            assert (await container_pool.get_stats())["stopped"] == 2
 
         finally:
             # Cleanup
@@ -278,7 +278,7 @@ class TestFullSessionWithRealDocker:
         await container_pool.release("error-session-001")
 
         # Pool should still be functional
-        assert container_pool.get_stats()["stopped"] > 0
+        assert (await container_pool.get_stats())["stopped"] > 0
 
         # Should be able to allocate another
         container2 = await container_pool.allocate("error-session-002")
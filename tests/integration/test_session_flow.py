@@ -80,7 +80,7 @@ class TestSessionHandlerWithRecorder:
         process = _mock_process()
 
         # Patch ContainerProxy to avoid real socket operations
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -113,7 +113,7 @@ class TestSessionHandlerWithRecorder:
         pool.allocate = AsyncMock(return_value=container)
         pool.release = AsyncMock()
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -168,7 +168,7 @@ class TestSessionHandlerErrorPaths:
         pool.allocate = AsyncMock(return_value=container)
         pool.release = AsyncMock()
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.start.side_effect = RuntimeError("exec failed")
             MockProxy.return_value = proxy_instance
@@ -198,7 +198,7 @@ class TestSessionHandlerErrorPaths:
         pool.allocate = AsyncMock(return_value=container)
         pool.release = AsyncMock()
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.start.side_effect = RuntimeError("boom")
             MockProxy.return_value = proxy_instance
@@ -229,7 +229,7 @@ class TestSessionHandlerMetadataFlow:
 
         session_info = _session_info()
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -258,7 +258,7 @@ class TestSessionHandlerMetadataFlow:
 
         pty = _pty_request()
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
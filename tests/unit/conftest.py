@@ -172,12 +172,14 @@ def patch_handler_deps():
         Args:
             proxy_async: If True, proxy instance is AsyncMock; else MagicMock
             recorder_async: If True, recorder instance is AsyncMock; else MagicMock
+                with an awaitable stop()
         """
-        with patch("hermes.__main__.ContainerProxy") as MockProxy, \
-             patch("hermes.__main__.SessionRecorder") as MockRecorder:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy, \
+             patch("hermes.session.recorder.SessionRecorder") as MockRecorder:
 
             proxy_inst = AsyncMock() if proxy_async else MagicMock()
             recorder_inst = AsyncMock() if recorder_async else MagicMock()
+            recorder_inst.stop = AsyncMock()
 
             MockProxy.return_value = proxy_inst
             MockRecorder.return_value = recorder_inst
@@ -3,23 +3,36 @@ Unit tests for AsyncSSH backend process factory and server components.
 """
 
 import asyncio
+import gc
+import logging
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import asyncssh
 import pytest
 
+from hermes.config import AuthenticationConfig
 from hermes.server.asyncssh_backend import AsyncSSHBackend, HermesSSHServer
 from hermes.server.backend import PTYRequest, SessionInfo
 
 
+@pytest.fixture(scope="module")
+def host_key_file(tmp_path_factory):
+    """Write a throwaway ed25519 host key."""
+    path = tmp_path_factory.mktemp("keys") / "ssh_host_key"
+    asyncssh.generate_private_key("ssh-ed25519").write_private_key(str(path))
+    return path
+
+
 @pytest.fixture
-def mock_config():
+def mock_config(host_key_file):
     """Create a minimal mock Config for backend instantiation."""
     config = MagicMock()
     config.server.host = "127.0.0.1"
     config.server.port = 2222
-    config.server.host_key_path = MagicMock()
-    config.server.host_key_path.exists.return_value = True
-    config.authentication = MagicMock()
+    config.server.host_key_path = host_key_file
+    config.server.max_concurrent_sessions = 10
+    config.authentication = AuthenticationConfig()
     return config
 
 
@@ -66,7 +79,7 @@ class TestAsyncSSHBackendInit:
         assert backend.config is mock_config
 
     def test_init_creates_empty_session_info_map(self, backend):
-        assert backend._session_info_map == {}
+        assert len(backend._session_info_map) == 0
 
     def test_init_no_server(self, backend):
         assert backend._server is None
@@ -95,7 +108,7 @@ class TestProcessFactory:
     @pytest.mark.asyncio
     async def test_extracts_pty_info(self, backend, session_info, mock_process):
         """Process factory should extract terminal type and size from process."""
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -112,7 +125,7 @@ class TestProcessFactory:
     @pytest.mark.asyncio
     async def test_passes_session_info(self, backend, session_info, mock_process):
         """Process factory should pass the correct SessionInfo to the handler."""
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -124,7 +137,7 @@ class TestProcessFactory:
     @pytest.mark.asyncio
     async def test_passes_process_to_handler(self, backend, session_info, mock_process):
         """Process factory should pass the SSHServerProcess to the handler."""
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -137,7 +150,7 @@ class TestProcessFactory:
     async def test_defaults_term_type_to_xterm(self, backend, session_info, mock_process):
         """Should default to 'xterm' when terminal type is None."""
         mock_process.get_terminal_type.return_value = None
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -150,7 +163,7 @@ class TestProcessFactory:
     async def test_defaults_term_size_when_none(self, backend, session_info, mock_process):
         """Should default to 80x24 when terminal size is None."""
         mock_process.get_terminal_size.return_value = None
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -176,10 +189,36 @@ class TestProcessFactory:
 
         mock_process.exit.assert_called_once_with(1)
 
+    @pytest.mark.asyncio
+    async def test_looks_up_session_info_by_connection(self, backend, mock_process):
+        """Concurrent connections must each get their own SessionInfo."""
+        mine = SessionInfo("mine", "a", "10.0.0.1", 1)
+        other = SessionInfo("other", "b", "10.0.0.2", 2)
+        other_conn = MagicMock()
+        backend._session_info_map[mock_process.channel.get_connection()] = mine
+        backend._session_info_map[other_conn] = other
+        handler = AsyncMock()
+        backend.session_handler = handler
+
+        await backend._process_factory(mock_process)
+
+        assert handler.call_args[0][0] is mine
+
+    @pytest.mark.asyncio
+    async def test_exits_with_1_when_connection_unknown(self, backend, session_info, mock_process):
+        """Should exit(1) when the connection has no registered SessionInfo."""
+        backend._session_info_map[MagicMock()] = session_info
+        backend.session_handler = AsyncMock()
+
+        await backend._process_factory(mock_process)
+
+        backend.session_handler.assert_not_called()
+        mock_process.exit.assert_called_once_with(1)
+
     @pytest.mark.asyncio
     async def test_exits_with_1_when_no_handler(self, backend, session_info, mock_process):
         """Should exit(1) when no session handler is registered."""
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         backend.session_handler = None
 
         await backend._process_factory(mock_process)
@@ -191,7 +230,7 @@ class TestProcessFactory:
         self, backend, session_info, mock_process
     ):
         """Should exit(0) after session handler completes normally."""
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -204,7 +243,7 @@ class TestProcessFactory:
         self, backend, session_info, mock_process
     ):
         """Should exit(0) even when session handler raises an exception."""
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock(side_effect=RuntimeError("boom"))
         backend.session_handler = handler
 
@@ -212,11 +251,49 @@ class TestProcessFactory:
 
         mock_process.exit.assert_called_once_with(0)
 
+    @pytest.mark.asyncio
+    async def test_rejects_sessions_over_limit(self, mock_config, session_info, mock_process):
+        """Sessions beyond max_concurrent_sessions exit(1) without reaching the handler."""
+        mock_config.server.max_concurrent_sessions = 1
+        backend = AsyncSSHBackend(mock_config)
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
+        release = asyncio.Event()
+
+        async def handler(*args):
+            await release.wait()
+
+        backend.session_handler = AsyncMock(side_effect=handler)
+        first = asyncio.create_task(backend._process_factory(mock_process))
+        await asyncio.sleep(0)
+
+        second_process = MagicMock()
+        second_process.channel.get_connection.return_value = (
+            mock_process.channel.get_connection.return_value
+        )
+        await backend._process_factory(second_process)
+
+        second_process.exit.assert_called_once_with(1)
+        assert backend.session_handler.call_count == 1
+
+        release.set()
+        await first
+        mock_process.exit.assert_called_once_with(0)
+
+    @pytest.mark.asyncio
+    async def test_session_slot_freed_after_handler(self, backend, session_info, mock_process):
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
+        backend.session_handler = AsyncMock(side_effect=RuntimeError("boom"))
+
+        await backend._process_factory(mock_process)
+
+        assert not backend._session_sem.locked()
+        assert backend._session_sem._value == 10
+
     @pytest.mark.asyncio
     async def test_pixel_dimensions_extracted(self, backend, session_info, mock_process):
         """Should extract pixel dimensions when available in term_size tuple."""
         mock_process.get_terminal_size.return_value = (132, 50, 1056, 800)
-        backend._session_info_map["test-session-1"] = session_info
+        backend._session_info_map[mock_process.channel.get_connection()] = session_info
         handler = AsyncMock()
         backend.session_handler = handler
 
@@ -248,8 +325,39 @@ class TestHermesSSHServer:
         assert server.session_info.source_ip == "10.0.0.1"
         assert server.session_info.source_port == 12345
         assert server.session_info.authenticated is False
-        # Also stored in backend map
-        assert len(backend._session_info_map) == 1
+        # Also stored in backend map, keyed by the connection
+        assert backend._session_info_map[conn] is server.session_info
+
+    def test_session_info_map_entry_dropped_with_connection(self, server, backend):
+        conn = MagicMock()
+        conn.get_extra_info.return_value = ("10.0.0.1", 12345)
+        server.connection_made(conn)
+        server.conn = None
+
+        del conn
+        gc.collect()
+
+        assert len(backend._session_info_map) == 0
+
+    def test_connection_id_is_random_hex(self, server):
+        conn = MagicMock()
+        conn.get_extra_info.return_value = ("10.0.0.1", 12345)
+
+        server.connection_made(conn)
+
+        assert len(server.connection_id) == 16
+        int(server.connection_id, 16)
+        assert server.session_info.session_id == server.connection_id
+
+    def test_connection_lost_logs_reason(self, server, caplog):
+        caplog.set_level(logging.INFO, logger="hermes.server.asyncssh_backend")
+        conn = MagicMock()
+        conn.get_extra_info.return_value = ("10.0.0.1", 12345)
+        server.connection_made(conn)
+
+        server.connection_lost(ConnectionResetError("reset by peer"))
+
+        assert f"Connection closed: {server.connection_id} (error: reset by peer)" in caplog.text
 
     def test_connection_made_unknown_peername(self, server):
         conn = MagicMock()
@@ -327,7 +435,7 @@ class TestAsyncSSHBackendStart:
 
     @pytest.mark.asyncio
     async def test_start_raises_if_no_host_key(self, mock_config):
-        mock_config.server.host_key_path.exists.return_value = False
+        mock_config.server.host_key_path = Path("/nonexistent/ssh_host_key")
         backend = AsyncSSHBackend(mock_config)
 
         with pytest.raises(RuntimeError, match="SSH host key not found"):
@@ -347,6 +455,68 @@ class TestAsyncSSHBackendStart:
             assert call_kwargs["process_factory"].__func__ is AsyncSSHBackend._process_factory
             assert call_kwargs["encoding"] is None
 
+    @pytest.mark.asyncio
+    async def test_server_factory_builds_bound_servers(self, backend):
+        handler = AsyncMock()
+        backend.set_session_handler(handler)
+        with patch("hermes.server.asyncssh_backend.asyncssh.listen", new_callable=AsyncMock) as mock_listen:
+            mock_listen.return_value = MagicMock()
+            await backend.start()
+
+            server = mock_listen.call_args[1]["server_factory"]()
+            assert isinstance(server, HermesSSHServer)
+            assert server.auth_manager is backend.auth_manager
+            assert server.session_handler is handler
+            assert server._backend is backend
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_reuse_port_by_default(self, backend):
+        with patch("hermes.server.asyncssh_backend.asyncssh.listen", new_callable=AsyncMock) as mock_listen:
+            mock_listen.return_value = MagicMock()
+            await backend.start()
+
+            assert mock_listen.call_args[1]["reuse_port"] is False
+
+    @pytest.mark.asyncio
+    async def test_start_reuses_port_for_workers(self, mock_config):
+        backend = AsyncSSHBackend(mock_config, reuse_port=True)
+        with patch("hermes.server.asyncssh_backend.asyncssh.listen", new_callable=AsyncMock) as mock_listen:
+            mock_listen.return_value = MagicMock()
+            await backend.start()
+
+            call_kwargs = mock_listen.call_args[1]
+            assert call_kwargs["reuse_port"] is True
+            assert call_kwargs["reuse_address"] is True
+
+    @pytest.mark.asyncio
+    async def test_start_passes_parsed_host_key(self, backend):
+        with patch("hermes.server.asyncssh_backend.asyncssh.listen", new_callable=AsyncMock) as mock_listen:
+            mock_listen.return_value = MagicMock()
+            await backend.start()
+
+            (host_key,) = mock_listen.call_args[1]["server_host_keys"]
+            assert isinstance(host_key, asyncssh.SSHKey)
+
+    @pytest.mark.asyncio
+    async def test_start_reuses_cached_host_key(self, mock_config):
+        with patch("hermes.server.asyncssh_backend.asyncssh.listen", new_callable=AsyncMock) as mock_listen:
+            mock_listen.return_value = MagicMock()
+            await AsyncSSHBackend(mock_config).start()
+            await AsyncSSHBackend(mock_config).start()
+
+            first, second = (c[1]["server_host_keys"][0] for c in mock_listen.call_args_list)
+            assert first is second
+
+    @pytest.mark.asyncio
+    async def test_start_wraps_unreadable_host_key(self, mock_config, tmp_path):
+        bad_key = tmp_path / "bad_key"
+        bad_key.write_text("not a key")
+        mock_config.server.host_key_path = bad_key
+        backend = AsyncSSHBackend(mock_config)
+
+        with pytest.raises(RuntimeError, match="Failed to start SSH server"):
+            await backend.start()
+
     @pytest.mark.asyncio
     async def test_stop_closes_server(self, backend):
         mock_server = MagicMock()
@@ -363,3 +533,18 @@ class TestAsyncSSHBackendStart:
     async def test_stop_noop_when_no_server(self, backend):
         """Stop should be safe to call when server is not running."""
         await backend.stop()  # Should not raise
+
+
+class TestSessionDataclasses:
+    def test_pty_request_is_immutable(self):
+        pty = PTYRequest(term_type="xterm", width=80, height=24)
+        with pytest.raises(AttributeError):
+            pty.width = 100
+
+    def test_session_info_is_mutable_and_slotted(self):
+        info = SessionInfo(
+            session_id="s1", username="", source_ip="10.0.0.1", source_port=22
+        )
+        info.authenticated = True
+        assert info.authenticated is True
+        assert not hasattr(info, "__dict__")
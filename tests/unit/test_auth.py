@@ -2,6 +2,8 @@
 Unit tests for AuthenticationManager.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from hermes.config import AuthenticationConfig
@@ -88,6 +90,9 @@ class TestAuthenticationManagerValidate:
         assert auth._failed_attempts["conn1"] == 1
         assert auth._failed_attempts["conn2"] == 1
 
+    def test_password_of_other_user_rejected(self, auth: AuthenticationManager):
+        assert auth.validate("conn1", "root", "admin123") is False
+
 
 class TestAcceptAllMode:
     def test_accept_all_after_n_failures(self, auth: AuthenticationManager):
@@ -140,3 +145,68 @@ class TestCleanupConnection:
         auth.cleanup_connection("conn1")
         # After cleanup, accept-all should no longer be active
         assert auth.validate("conn1", "x", "x") is False
+
+
+class TestConstantTimeComparison:
+    def test_uses_compare_digest_for_wrong_password(self, auth: AuthenticationManager):
+        with patch("hermes.server.auth.hmac.compare_digest", return_value=True) as mock_cmp:
+            assert auth.validate("conn1", "root", "wrong") is False
+        mock_cmp.assert_called_once_with(b"toor", b"wrong")
+
+    def test_uses_compare_digest_for_unknown_user(self, auth: AuthenticationManager):
+        with patch("hermes.server.auth.hmac.compare_digest", return_value=True) as mock_cmp:
+            # A matching dummy compare must never authenticate an unknown user
+            assert auth.validate("conn1", "nobody", "pass") is False
+        mock_cmp.assert_called_once_with(auth._dummy_password, b"pass")
+
+    def test_dummy_password_cannot_authenticate(self, auth: AuthenticationManager):
+        assert auth.validate("conn1", "nobody", auth._dummy_password.decode()) is False
+
+    def test_non_ascii_password(self):
+        config = AuthenticationConfig(
+            static_credentials=[
+                AuthenticationConfig.Credential(username="root", password="pässwörd"),
+            ],
+            accept_all_after_failures=0,
+        )
+        mgr = AuthenticationManager(config)
+        assert mgr.validate("conn1", "root", "pässwörd") is True
+        assert mgr.validate("conn1", "root", "passwort") is False
+
+
+class TestFailureCounterStorage:
+    def test_accept_all_check_does_not_create_entries(self, auth: AuthenticationManager):
+        assert auth._should_accept_all("never-seen") is False
+        assert "never-seen" not in auth._failed_attempts
+
+    def test_successful_auth_leaves_no_entry(self, auth: AuthenticationManager):
+        auth.validate("conn1", "root", "toor")
+        assert "conn1" not in auth._failed_attempts
+
+    def test_tracked_connections_are_capped(self, auth: AuthenticationManager):
+        with patch("hermes.server.auth.MAX_TRACKED_CONNECTIONS", 2):
+            auth.validate("conn1", "x", "x")
+            auth.validate("conn2", "x", "x")
+            auth.validate("conn3", "x", "x")
+        assert list(auth._failed_attempts) == ["conn2", "conn3"]
+
+    def test_repeat_failure_refreshes_eviction_order(self, auth: AuthenticationManager):
+        with patch("hermes.server.auth.MAX_TRACKED_CONNECTIONS", 2):
+            auth.validate("conn1", "x", "x")
+            auth.validate("conn2", "x", "x")
+            auth.validate("conn1", "x", "x")
+            auth.validate("conn3", "x", "x")
+        assert auth._failed_attempts == {"conn1": 2, "conn3": 1}
+
+
+class TestAcceptAllFastPath:
+    def test_disabled_skips_accept_all_check(self, auth_no_accept: AuthenticationManager):
+        with patch.object(auth_no_accept, "_should_accept_all") as mock_check:
+            auth_no_accept.validate("conn1", "x", "x")
+        mock_check.assert_not_called()
+
+    def test_enabled_flag_reflects_config(
+        self, auth: AuthenticationManager, auth_no_accept: AuthenticationManager
+    ):
+        assert auth._accept_all_enabled is True
+        assert auth_no_accept._accept_all_enabled is False
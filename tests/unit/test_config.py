@@ -2,8 +2,12 @@
 Unit tests for configuration loading and validation.
 """
 
+import logging
+
 import pytest
+import yaml
 from pathlib import Path
+from unittest.mock import patch
 
 from hermes.config import (
     AuthenticationConfig,
@@ -14,6 +18,7 @@ from hermes.config import (
     LoggingConfig,
     RecordingConfig,
     ServerConfig,
+    _parse_cached,
 )
 
 
@@ -24,6 +29,11 @@ class TestServerConfig:
         assert c.port == 2222
         assert c.max_concurrent_sessions == 10
         assert c.session_timeout == 3600
+        assert c.workers == 1
+
+    def test_workers_minimum(self):
+        with pytest.raises(Exception):
+            ServerConfig(workers=0)
 
     def test_port_bounds(self):
         with pytest.raises(Exception):
@@ -79,6 +89,21 @@ class TestContainerSecurityConfig:
         with pytest.raises(Exception):
             ContainerSecurityConfig(pids_limit=5)
 
+    def test_high_cpu_quota_warns_at_validation(self, caplog):
+        caplog.set_level(logging.WARNING, logger="hermes.config")
+        ContainerSecurityConfig(cpu_quota=4.0)
+        assert "High CPU quota configured: 4.0 cores" in caplog.text
+
+    def test_low_pids_limit_warns_at_validation(self, caplog):
+        caplog.set_level(logging.WARNING, logger="hermes.config")
+        ContainerSecurityConfig(pids_limit=20)
+        assert "Very low PIDs limit: 20" in caplog.text
+
+    def test_default_security_config_does_not_warn(self, caplog):
+        caplog.set_level(logging.WARNING, logger="hermes.config")
+        ContainerSecurityConfig()
+        assert caplog.text == ""
+
 
 class TestContainerPoolConfig:
     def test_defaults(self):
@@ -90,6 +115,21 @@ class TestContainerPoolConfig:
         with pytest.raises(Exception):
             ContainerPoolConfig(size=0)
 
+    def test_release_strategy_defaults_to_stop(self):
+        assert ContainerPoolConfig().release_strategy == "stop"
+
+    def test_release_strategy_rejects_unknown(self):
+        with pytest.raises(Exception):
+            ContainerPoolConfig(release_strategy="recycle")
+
+    def test_keep_alive_requires_reset_command(self):
+        with pytest.raises(Exception, match="requires a reset_command"):
+            ContainerPoolConfig(release_strategy="keep_alive")
+
+    def test_keep_alive_with_reset_command(self):
+        c = ContainerPoolConfig(release_strategy="keep_alive", reset_command=["/bin/true"])
+        assert c.reset_command == ["/bin/true"]
+
 
 class TestRecordingConfig:
     def test_defaults(self):
@@ -113,6 +153,11 @@ class TestDockerConfig:
 
 
 class TestConfigFromFile:
+    @pytest.fixture(autouse=True)
+    def clear_config_cache(self):
+        """Start each test with an empty parse cache; identical content is shared."""
+        _parse_cached.cache_clear()
+
     def test_load_from_yaml(self, test_config_path: Path):
         config = Config.from_file(test_config_path)
         assert config.server.host == "127.0.0.1"
@@ -123,6 +168,16 @@ class TestConfigFromFile:
         with pytest.raises(FileNotFoundError):
             Config.from_file(tmp_path / "nonexistent.yaml")
 
+    def test_utf8_values(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            'authentication:\n  static_credentials:\n    - username: "r\u00f6ot"\n'
+            '      password: "p\u00e4ss"\n',
+            encoding="utf-8",
+        )
+        cred = Config.from_file(config_file).authentication.static_credentials[0]
+        assert (cred.username, cred.password) == ("r\u00f6ot", "p\u00e4ss")
+
     def test_default_config(self):
         config = Config()
         assert config.server.port == 2222
@@ -147,3 +202,43 @@ class TestConfigFromFile:
         # yaml.safe_load returns None for empty file, which should fail
         with pytest.raises(Exception):
             Config.from_file(empty_file)
+
+    def test_unchanged_file_is_parsed_once(self, test_config_path: Path):
+        with patch("hermes.config.yaml.load", wraps=yaml.load) as mock_load:
+            Config.from_file(test_config_path)
+            Config.from_file(test_config_path)
+        mock_load.assert_called_once()
+
+    def test_identical_content_is_parsed_once(self, tmp_path: Path):
+        first = tmp_path / "first.yaml"
+        second = tmp_path / "second.yaml"
+        first.write_text("server:\n  port: 2233\n")
+        second.write_text("server:\n  port: 2233\n")
+        with patch("hermes.config.yaml.load", wraps=yaml.load) as mock_load:
+            assert Config.from_file(first).server.port == 2233
+            assert Config.from_file(second).server.port == 2233
+        mock_load.assert_called_once()
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("server:\n  port: 2222\n")
+        assert Config.from_file(config_file).server.port == 2222
+
+        config_file.write_text("server:\n  port: 22222\n")
+        assert Config.from_file(config_file).server.port == 22222
+
+    def test_returns_independent_copies(self, test_config_path: Path):
+        first = Config.from_file(test_config_path)
+        first.server.port = 4444
+        second = Config.from_file(test_config_path)
+        assert second.server.port == 2222
+
+    def test_env_overrides_apply_after_cached_parse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("server:\n  port: 2233\n")
+        assert Config.from_file(config_file).docker.base_url is None
+
+        monkeypatch.setenv("DOCKER", '{"base_url": "tcp://docker:2375"}')
+        assert Config.from_file(config_file).docker.base_url == "tcp://docker:2375"
@@ -3,13 +3,17 @@ Unit tests for ContainerPool.
 """
 
 import asyncio
-from datetime import datetime
+import logging
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import docker
 import pytest
+import requests
 
 from hermes.config import ContainerPoolConfig
-from hermes.container.pool import ContainerPool
+from hermes.container.pool import CREATE_ATTEMPTS, ContainerPool
 
 
 def _mock_container(container_id: str = "abc123456789") -> MagicMock:
@@ -45,42 +49,95 @@ def pool(docker_client: MagicMock, pool_config: ContainerPoolConfig) -> Containe
 
 class TestContainerPoolInit:
     def test_initial_state(self, pool: ContainerPool):
-        assert pool.ready_pool == []
+        assert len(pool.ready_pool) == 0
         assert pool.active_sessions == {}
-        assert pool.stopped_containers == []
+        assert len(pool.stopped_containers) == 0
         assert pool._shutdown is False
 
     def test_stores_config(self, pool: ContainerPool, pool_config: ContainerPoolConfig):
         assert pool.config is pool_config
 
+    def test_executor_covers_default_session_cap(self, pool: ContainerPool):
+        # Default max_concurrent_sessions (10) plus the pool size (2)
+        assert pool._executor._max_workers == 12
+
+    def test_executor_size_is_configurable(
+        self, docker_client: MagicMock, pool_config: ContainerPoolConfig
+    ):
+        pool = ContainerPool(docker_client, pool_config, max_workers=42)
+        assert pool._executor._max_workers == 42
+
 
 class TestContainerPoolInitialize:
+    @pytest.mark.asyncio
+    async def test_docker_calls_use_dedicated_executor(
+        self, pool: ContainerPool, docker_client: MagicMock
+    ):
+        threads = []
+
+        def create(**kw):
+            threads.append(threading.current_thread().name)
+            return _mock_container()
+
+        docker_client.containers.create.side_effect = create
+        await pool.initialize()
+        assert threads and all(t.startswith("hermes-docker") for t in threads)
+
     @pytest.mark.asyncio
     async def test_creates_pool_size_containers(self, pool: ContainerPool, docker_client: MagicMock):
         await pool.initialize()
         assert len(pool.ready_pool) == 2
 
+    @pytest.mark.asyncio
+    async def test_creation_concurrency_is_bounded(self, docker_client: MagicMock):
+        config = ContainerPoolConfig(size=6, image="test-target:latest", create_concurrency=2)
+        pool = ContainerPool(docker_client, config)
+        in_flight = 0
+        peak = 0
+
+        async def fake_executor(executor, func, *args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor", side_effect=fake_executor):
+            await pool.initialize()
+
+        assert len(pool.ready_pool) == 6
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_initialize_failure_cleans_up(self, pool: ContainerPool, docker_client: MagicMock):
         docker_client.containers.create.side_effect = Exception("docker down")
         with pytest.raises(RuntimeError, match="Container pool initialization failed"):
             await pool.initialize()
-        assert pool.ready_pool == []
+        assert len(pool.ready_pool) == 0
 
 
 class TestContainerPoolAllocate:
+    @pytest.mark.asyncio
+    async def test_allocate_takes_oldest_container_first(self, pool: ContainerPool):
+        first, second = _mock_container("first"), _mock_container("second")
+        pool.ready_pool.extend([first, second])
+        assert await pool.allocate("session-1") is first
+        assert list(pool.ready_pool) == [second]
+
     @pytest.mark.asyncio
     async def test_allocate_from_ready_pool(self, pool: ContainerPool):
         container = _mock_container("ready1")
         pool.ready_pool.append(container)
         result = await pool.allocate("session-1")
         assert result is container
-        assert pool.ready_pool == []
+        assert len(pool.ready_pool) == 0
         assert pool.active_sessions["session-1"] is container
 
     @pytest.mark.asyncio
     async def test_allocate_creates_on_demand_when_empty(self, pool: ContainerPool, docker_client: MagicMock):
-        assert pool.ready_pool == []
+        assert len(pool.ready_pool) == 0
         result = await pool.allocate("session-1")
         assert result is not None
         assert "session-1" in pool.active_sessions
@@ -95,18 +152,50 @@ class TestContainerPoolAllocate:
     async def test_allocate_spawns_replacement(self, pool: ContainerPool):
         container = _mock_container()
         pool.ready_pool.append(container)
-        with patch.object(pool, "_spawn_replacement", new_callable=AsyncMock) as mock_spawn:
+        with patch.object(pool, "_replenish", new_callable=AsyncMock) as mock_replenish:
             await pool.allocate("s1")
             # Give the created task a chance to run
             await asyncio.sleep(0.01)
+            mock_replenish.assert_awaited_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_allocate_burst_coalesces_replenish(self, pool: ContainerPool):
+        pool.ready_pool.extend([_mock_container("a"), _mock_container("b")])
+        with patch.object(pool, "_replenish", new_callable=AsyncMock) as mock_replenish:
+            await pool.allocate("s1")
+            await pool.allocate("s2")
+            await asyncio.sleep(0.01)
+        # The first allocation reserves one slot, the second only the remainder
+        assert [c.args for c in mock_replenish.await_args_list] == [(1,), (1,)]
+        assert pool._in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_allocate_skips_replenish_when_in_flight_covers_deficit(
+        self, pool: ContainerPool
+    ):
+        pool.ready_pool.append(_mock_container())
+        pool._in_flight = 2
+        with patch.object(pool, "_replenish", new_callable=AsyncMock) as mock_replenish:
+            await pool.allocate("s1")
+            await asyncio.sleep(0.01)
+        mock_replenish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_allocate_logs_short_container_id(self, pool: ContainerPool, caplog):
+        caplog.set_level(logging.INFO, logger="hermes.container.pool")
+        pool.ready_pool.append(_mock_container("0123456789abcdef"))
+        with patch.object(pool, "_replenish", new_callable=AsyncMock):
+            await pool.allocate("s1")
+        assert "Container 0123456789ab allocated to session s1" in caplog.text
+        assert "0123456789abc" not in caplog.text
 
     @pytest.mark.asyncio
-    async def test_reload_failure_does_not_block(self, pool: ContainerPool):
+    async def test_allocate_does_not_reload_container(self, pool: ContainerPool):
         container = _mock_container()
-        container.reload.side_effect = Exception("reload failed")
         pool.ready_pool.append(container)
         result = await pool.allocate("s1")
         assert result is container
+        container.reload.assert_not_called()
 
 
 class TestContainerPoolRelease:
@@ -125,7 +214,28 @@ class TestContainerPoolRelease:
         await pool.release("s1")
         assert len(pool.stopped_containers) == 1
         assert pool.stopped_containers[0][0] is container
-        assert isinstance(pool.stopped_containers[0][1], datetime)
+        assert isinstance(pool.stopped_containers[0][1], float)
+
+    @pytest.mark.asyncio
+    async def test_stopped_records_bounded_by_forensics_max(self, docker_client: MagicMock):
+        config = ContainerPoolConfig(size=2, image="test-target:latest", forensics_max=2)
+        pool = ContainerPool(docker_client, config)
+        containers = [_mock_container(str(i)) for i in range(3)]
+        for i, container in enumerate(containers):
+            pool.active_sessions[f"s{i}"] = container
+            await pool.release(f"s{i}")
+        assert [c for c, _ in pool.stopped_containers] == containers[1:]
+        stats = await pool.get_stats()
+        assert stats["stopped"] == 2
+        assert stats["stopped_total"] == 3
+
+    def test_stopped_records_expire_after_ttl(self, pool: ContainerPool):
+        old, new = _mock_container("old"), _mock_container("new")
+        day = 86400
+        pool._track_stopped(old, 0.0)
+        pool._track_stopped(new, (pool.config.cleanup_stopped_after_days + 1) * day)
+        assert [c for c, _ in pool.stopped_containers] == [new]
+        assert pool._total_stopped == 2
 
     @pytest.mark.asyncio
     async def test_release_unknown_session_no_error(self, pool: ContainerPool):
@@ -140,7 +250,158 @@ class TestContainerPoolRelease:
         assert "s1" not in pool.active_sessions
 
 
+class TestContainerPoolRecycle:
+    def _pool(self, docker_client: MagicMock, strategy: str) -> ContainerPool:
+        config = ContainerPoolConfig(
+            size=2,
+            image="test-target:latest",
+            spawn_timeout=5,
+            release_strategy=strategy,
+            reset_command=["/usr/local/bin/reset-workspace.sh"],
+        )
+        return ContainerPool(docker_client, config)
+
+    @pytest.mark.asyncio
+    async def test_pause_parks_container(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "pause")
+        container = _mock_container()
+        pool.active_sessions["s1"] = container
+        await pool.release("s1")
+        container.pause.assert_called_once()
+        container.stop.assert_not_called()
+        assert list(pool.paused_pool) == [container]
+        assert len(pool.stopped_containers) == 0
+
+    @pytest.mark.asyncio
+    async def test_allocate_unpauses_when_ready_pool_empty(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "pause")
+        container = _mock_container()
+        pool.paused_pool.append(container)
+        with patch.object(pool, "_replenish", new_callable=AsyncMock):
+            assert await pool.allocate("s1") is container
+        container.unpause.assert_called_once()
+        docker_client.containers.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_unpause_stops_and_falls_through(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "pause")
+        broken = _mock_container("broken")
+        broken.unpause.side_effect = Exception("gone")
+        pool.paused_pool.append(broken)
+        with patch.object(pool, "_replenish", new_callable=AsyncMock):
+            result = await pool.allocate("s1")
+        assert result is not broken
+        broken.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_unpause_stops_outside_lock(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "pause")
+        broken = _mock_container("broken")
+        broken.unpause.side_effect = Exception("gone")
+        pool.paused_pool.append(broken)
+        lock_held = []
+
+        async def stop_containers(containers):
+            lock_held.append(pool._lock.locked())
+
+        with patch.object(pool, "_replenish", new_callable=AsyncMock):
+            with patch.object(pool, "_stop_containers", side_effect=stop_containers):
+                await pool.allocate("s1")
+        assert lock_held == [False]
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_resets_and_returns_to_ready(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "keep_alive")
+        container = _mock_container()
+        container.exec_run.return_value = MagicMock(exit_code=0)
+        pool.active_sessions["s1"] = container
+        await pool.release("s1")
+        container.exec_run.assert_called_once_with(["/usr/local/bin/reset-workspace.sh"])
+        assert list(pool.ready_pool) == [container]
+        container.stop.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_failed_reset_stops(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "keep_alive")
+        container = _mock_container()
+        container.exec_run.return_value = MagicMock(exit_code=1)
+        pool.active_sessions["s1"] = container
+        await pool.release("s1")
+        assert len(pool.ready_pool) == 0
+        container.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_recycle_stops_when_pool_full(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "pause")
+        pool.ready_pool.extend([_mock_container("a"), _mock_container("b")])
+        container = _mock_container()
+        pool.active_sessions["s1"] = container
+        await pool.release("s1")
+        container.pause.assert_not_called()
+        container.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_counts_replenish_in_flight(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "keep_alive")
+        pool.ready_pool.append(_mock_container("a"))
+        created = asyncio.Event()
+
+        async def slow_create():
+            await created.wait()
+            return _mock_container("new")
+
+        pool._in_flight = 1
+        with patch.object(pool, "_create_container_sync", side_effect=slow_create):
+            replenish = asyncio.create_task(pool._replenish(1))
+            container = _mock_container()
+            container.exec_run.return_value = MagicMock(exit_code=0)
+            pool.active_sessions["s1"] = container
+            await pool.release("s1")
+            created.set()
+            await replenish
+
+        container.exec_run.assert_not_called()
+        container.stop.assert_called_once()
+        assert len(pool.ready_pool) == 2
+
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_paused_containers(self, docker_client: MagicMock):
+        pool = self._pool(docker_client, "pause")
+        container = _mock_container()
+        pool.paused_pool.append(container)
+        await pool.shutdown()
+        container.stop.assert_called_once()
+        assert len(pool.paused_pool) == 0
+
+
 class TestContainerPoolShutdown:
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_executor(self, pool: ContainerPool):
+        await pool.shutdown()
+        with pytest.raises(RuntimeError):
+            pool._executor.submit(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_replenish(self, pool: ContainerPool):
+        created = _mock_container()
+        release_create = asyncio.Event()
+
+        async def slow_create():
+            await release_create.wait()
+            return created
+
+        pool.ready_pool.append(_mock_container())
+        with patch.object(pool, "_create_container_sync", side_effect=slow_create):
+            await pool.allocate("s1")
+            shutdown = asyncio.create_task(pool.shutdown())
+            await asyncio.sleep(0.01)
+            assert not shutdown.done()
+            release_create.set()
+            await shutdown
+        # The late container was stopped rather than left running
+        created.stop.assert_called_with(10)
+        assert len(pool._replenish_tasks) == 0
+
     @pytest.mark.asyncio
     async def test_shutdown_stops_active_containers(self, pool: ContainerPool):
         c1 = _mock_container("active1")
@@ -156,7 +417,7 @@ class TestContainerPoolShutdown:
         pool.ready_pool.append(c1)
         await pool.shutdown()
         c1.stop.assert_called_once()
-        assert pool.ready_pool == []
+        assert len(pool.ready_pool) == 0
 
     @pytest.mark.asyncio
     async def test_shutdown_preserves_stopped_containers(self, pool: ContainerPool):
@@ -172,23 +433,170 @@ class TestContainerPoolShutdown:
         pool.active_sessions["s1"] = c1
         await pool.shutdown()  # should not raise
 
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_containers_concurrently(self, pool: ContainerPool):
+        in_flight = 0
+        peak = 0
+
+        async def fake_executor(executor, func, *args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return func(*args)
+
+        pool.active_sessions["s1"] = _mock_container("active1")
+        pool.ready_pool.extend([_mock_container("ready1"), _mock_container("ready2")])
 
-class TestContainerPoolSpawnReplacement:
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor", side_effect=fake_executor):
+            await pool.shutdown()
+
+        assert peak == 3
+        assert len(pool.stopped_containers) == 3
+
+    @pytest.mark.asyncio
+    async def test_shutdown_does_not_track_failed_stops(self, pool: ContainerPool):
+        failing = _mock_container("bad")
+        failing.stop.side_effect = Exception("fail")
+        ok = _mock_container("good")
+        pool.active_sessions.update({"s1": failing, "s2": ok})
+        await pool.shutdown()
+        assert [c for c, _ in pool.stopped_containers] == [ok]
+
+
+class TestContainerPoolReplenish:
     @pytest.mark.asyncio
-    async def test_spawn_replacement_adds_to_pool(self, pool: ContainerPool, docker_client: MagicMock):
-        await pool._spawn_replacement()
-        assert len(pool.ready_pool) == 1
+    async def test_replenish_adds_to_pool(self, pool: ContainerPool, docker_client: MagicMock):
+        pool._in_flight = 2
+        await pool._replenish(2)
+        assert len(pool.ready_pool) == 2
+        assert pool._in_flight == 0
 
     @pytest.mark.asyncio
-    async def test_spawn_replacement_skipped_during_shutdown(self, pool: ContainerPool, docker_client: MagicMock):
+    async def test_replenish_skipped_during_shutdown(self, pool: ContainerPool, docker_client: MagicMock):
         pool._shutdown = True
-        await pool._spawn_replacement()
+        pool._in_flight = 1
+        await pool._replenish(1)
         assert len(pool.ready_pool) == 0
+        assert pool._in_flight == 0
+        docker_client.containers.create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_spawn_replacement_failure_does_not_raise(self, pool: ContainerPool, docker_client: MagicMock):
+    async def test_replenish_failure_does_not_raise(self, pool: ContainerPool, docker_client: MagicMock):
         docker_client.containers.create.side_effect = Exception("fail")
-        await pool._spawn_replacement()  # should not raise
+        pool._in_flight = 1
+        await pool._replenish(1)  # should not raise
+        assert pool._in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_replenish_keeps_partial_success(self, pool: ContainerPool, docker_client: MagicMock):
+        good = _mock_container("good")
+        docker_client.containers.create.side_effect = [good, Exception("fail")]
+        pool._in_flight = 2
+        await pool._replenish(2)
+        assert list(pool.ready_pool) == [good]
+
+    @pytest.mark.asyncio
+    async def test_replenish_stops_containers_created_during_shutdown(self, pool: ContainerPool):
+        created = _mock_container()
+
+        async def create_then_shutdown():
+            pool._shutdown = True
+            return created
+
+        pool._in_flight = 1
+        with patch.object(pool, "_create_container_sync", side_effect=create_then_shutdown):
+            await pool._replenish(1)
+        assert len(pool.ready_pool) == 0
+        created.stop.assert_called_once_with(10)
+
+
+def _api_error(status_code: int) -> docker.errors.APIError:
+    return docker.errors.APIError("error", response=MagicMock(status_code=status_code))
+
+
+class TestContainerPoolCreateRetry:
+    @pytest.fixture(autouse=True)
+    def no_backoff(self):
+        with patch("hermes.container.pool.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            yield sleep
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(
+        self, pool: ContainerPool, docker_client: MagicMock, no_backoff: AsyncMock
+    ):
+        good = _mock_container("good")
+        docker_client.containers.create.side_effect = [_api_error(500), _api_error(503), good]
+        assert await pool._create_container_sync() is good
+        assert [c.args[0] for c in no_backoff.await_args_list] == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_connection_error_is_retried(
+        self, pool: ContainerPool, docker_client: MagicMock, no_backoff: AsyncMock
+    ):
+        good = _mock_container("good")
+        docker_client.containers.create.side_effect = [
+            requests.exceptions.ConnectionError("connection reset"),
+            good,
+        ]
+        assert await pool._create_container_sync() is good
+        no_backoff.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_runtime_error_after_retries(
+        self, pool: ContainerPool, docker_client: MagicMock
+    ):
+        docker_client.containers.create.side_effect = requests.exceptions.ReadTimeout("slow")
+        with pytest.raises(RuntimeError, match="Failed to create container"):
+            await pool._create_container_sync()
+        assert docker_client.containers.create.call_count == CREATE_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_is_not_retried(
+        self, pool: ContainerPool, docker_client: MagicMock, no_backoff: AsyncMock
+    ):
+        docker_client.containers.create.side_effect = docker.errors.ImageNotFound("no image")
+        with pytest.raises(RuntimeError, match="Failed to create container"):
+            await pool._create_container_sync()
+        assert docker_client.containers.create.call_count == 1
+        no_backoff.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, pool: ContainerPool, docker_client: MagicMock):
+        docker_client.containers.create.side_effect = _api_error(500)
+        with pytest.raises(RuntimeError, match="Failed to create container"):
+            await pool._create_container_sync()
+        assert docker_client.containers.create.call_count == CREATE_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_fresh_name(self, pool: ContainerPool, docker_client: MagicMock):
+        docker_client.containers.create.side_effect = [_api_error(500), _mock_container()]
+        await pool._create_container_sync()
+        names = [c.kwargs["name"] for c in docker_client.containers.create.call_args_list]
+        assert len(set(names)) == 2
+
+    @pytest.mark.asyncio
+    async def test_backoff_releases_creation_slot(
+        self, pool: ContainerPool, docker_client: MagicMock, no_backoff: AsyncMock
+    ):
+        pool._create_sem = asyncio.Semaphore(1)
+        slot_free_during_backoff = []
+
+        async def sleep(delay):
+            slot_free_during_backoff.append(not pool._create_sem.locked())
+
+        no_backoff.side_effect = sleep
+        docker_client.containers.create.side_effect = [_api_error(500), _mock_container()]
+        await pool._create_container_sync()
+        assert slot_free_during_backoff == [True]
+
+    @pytest.mark.asyncio
+    async def test_no_attempts_raises(self, pool: ContainerPool):
+        with patch("hermes.container.pool.CREATE_ATTEMPTS", 0):
+            with pytest.raises(RuntimeError, match="no attempts made"):
+                await pool._create_container_sync()
 
 
 class TestContainerPoolHelpers:
@@ -196,15 +604,27 @@ class TestContainerPoolHelpers:
         name = pool._generate_container_name()
         assert name.startswith("hermes-target-")
 
+    def test_generate_container_name_random_id_is_hex(self, pool: ContainerPool):
+        id_part = pool._generate_container_name().split("-")[2]
+        assert len(id_part) == 8
+        int(id_part, 16)
+
+    def test_generate_container_name_uses_utc_timestamp(self, pool: ContainerPool):
+        with patch("hermes.container.pool.time.gmtime", return_value=time.gmtime(0)):
+            name = pool._generate_container_name("abcdefghij")
+        assert name == "hermes-target-abcdefgh-19700101-000000"
+
     def test_generate_container_name_with_session_id(self, pool: ContainerPool):
         name = pool._generate_container_name("abcdefghij")
         assert "abcdefgh" in name
 
-    def test_get_stats(self, pool: ContainerPool):
-        pool.ready_pool = [_mock_container()]
+    @pytest.mark.asyncio
+    async def test_get_stats(self, pool: ContainerPool):
+        pool.ready_pool.append(_mock_container())
         pool.active_sessions = {"s1": _mock_container()}
-        stats = pool.get_stats()
+        stats = await pool.get_stats()
         assert stats["ready"] == 1
+        assert stats["paused"] == 0
         assert stats["active"] == 1
         assert stats["stopped"] == 0
         assert stats["total"] == 2
@@ -11,6 +11,19 @@ from hermes.server.backend import PTYRequest
 from hermes.session.proxy import ContainerProxy
 
 
+def recv_into_chunks(*chunks):
+    """Build a loop.sock_recv_into side effect that serves chunks, then EOF."""
+    pending = list(chunks)
+
+    async def fake_recv_into(sock, buf):
+        if not pending:
+            return 0
+        data = pending.pop(0)
+        buf[: len(data)] = data
+        return len(data)
+
+    return fake_recv_into
+
 
 
 
@@ -248,14 +261,27 @@ class TestContainerProxyWaitCompletion:
     """Tests for wait_completion."""
 
     @pytest.mark.asyncio
-    async def test_wait_completion_returns_on_shutdown_event(self, proxy):
-        """wait_completion should return once _shutdown_event is set."""
-        # Set the event in a short delay
-        async def set_event():
+    async def test_wait_completion_returns_when_either_task_exits(self, proxy):
+        """wait_completion should return once one I/O task finishes."""
+
+        async def finishes_quickly():
             await asyncio.sleep(0.01)
-            proxy._shutdown_event.set()
 
-        asyncio.create_task(set_event())
+        async def runs_forever():
+            await asyncio.sleep(10)
+
+        proxy.ssh_to_container_task = asyncio.create_task(finishes_quickly())
+        proxy.container_to_ssh_task = asyncio.create_task(runs_forever())
+
+        await asyncio.wait_for(proxy.wait_completion(), timeout=1.0)
+
+        assert proxy.ssh_to_container_task.done()
+        assert not proxy.container_to_ssh_task.done()
+        proxy.container_to_ssh_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_wait_completion_returns_when_not_started(self, proxy):
+        """wait_completion should not hang if start() was never called."""
         await asyncio.wait_for(proxy.wait_completion(), timeout=1.0)
 
 
@@ -263,19 +289,17 @@ class TestSSHToContainer:
     """Tests for the _ssh_to_container streaming task."""
 
     @pytest.mark.asyncio
-    async def test_ssh_disconnect_sets_shutdown(self, proxy, mock_process):
-        """When stdin returns empty data, shutdown event should be set."""
+    async def test_ssh_disconnect_ends_task(self, proxy, mock_process):
+        """When stdin returns empty data, the task should end."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
         mock_process.stdin.read = AsyncMock(return_value=b"")
 
         await proxy._ssh_to_container()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
-    async def test_broken_pipe_sets_shutdown(self, proxy, mock_process):
-        """BrokenPipeError during write should set shutdown event."""
+    async def test_broken_pipe_ends_task(self, proxy, mock_process):
+        """BrokenPipeError during write should end the task."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
         mock_process.stdin.read = AsyncMock(return_value=b"data")
@@ -284,183 +308,173 @@ class TestSSHToContainer:
         with patch.object(loop, "sock_sendall", side_effect=BrokenPipeError):
             await proxy._ssh_to_container()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
-    async def test_blocking_io_error_with_retry(self, proxy, mock_process):
-        """BlockingIOError during write should retry after sleep."""
+    async def test_blocking_io_error_not_retried(self, proxy, mock_process):
+        """sock_sendall awaits writability itself, so there is no sleep-and-retry path."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
+        mock_process.stdin.read = AsyncMock(return_value=b"data")
 
-        read_count = [0]
-        sendall_count = [0]
-
-        async def read_data(size):
-            read_count[0] += 1
-            if read_count[0] == 1:
-                return b"data"
-            return b""  # EOF after first read
+        loop = asyncio.get_event_loop()
+        with patch.object(loop, "sock_sendall", side_effect=BlockingIOError) as mock_send:
+            with patch("hermes.session.proxy.asyncio.sleep") as mock_sleep:
+                await proxy._ssh_to_container()
 
-        async def sendall_with_retry(sock, data):
-            sendall_count[0] += 1
-            if sendall_count[0] == 1:
-                raise BlockingIOError("Resource temporarily unavailable")
-            # Second call succeeds
+        mock_send.assert_called_once()
+        mock_sleep.assert_not_called()
 
-        mock_process.stdin.read = read_data
+    @pytest.mark.asyncio
+    async def test_reads_stdin_in_large_chunks(self, proxy, mock_process):
+        """stdin should be read with a 64 KiB limit so pastes are forwarded in one send."""
+        proxy._running = True
+        proxy.exec_socket = MagicMock()
+        mock_process.stdin.read = AsyncMock(return_value=b"")
 
-        loop = asyncio.get_event_loop()
-        with patch.object(loop, "sock_sendall", side_effect=sendall_with_retry):
-            await proxy._ssh_to_container()
+        await proxy._ssh_to_container()
 
-        # Verify retry happened (called twice)
-        assert sendall_count[0] == 2
-        assert proxy._shutdown_event.is_set()
+        mock_process.stdin.read.assert_called_once_with(65536)
 
     @pytest.mark.asyncio
-    async def test_connection_reset_error_sets_shutdown(self, proxy, mock_process):
-        """ConnectionResetError should set shutdown event gracefully."""
+    async def test_connection_reset_error_ends_task(self, proxy, mock_process):
+        """ConnectionResetError should end the task gracefully."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
         mock_process.stdin.read = AsyncMock(side_effect=ConnectionResetError("reset"))
 
         await proxy._ssh_to_container()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
     async def test_generic_exception_in_ssh_to_container(self, proxy, mock_process):
-        """Generic exception should set shutdown event and log."""
+        """Generic exception should end the task and log."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
         mock_process.stdin.read = AsyncMock(side_effect=RuntimeError("unexpected"))
 
         await proxy._ssh_to_container()
 
-        assert proxy._shutdown_event.is_set()
-
 
 class TestContainerToSSH:
     """Tests for the _container_to_ssh streaming task."""
 
     @pytest.mark.asyncio
-    async def test_container_end_sets_shutdown(self, proxy, mock_process):
-        """When exec socket returns empty, shutdown event should be set."""
+    async def test_container_end_ends_task(self, proxy, mock_process):
+        """When exec socket returns empty, the task should end."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
         loop = asyncio.get_event_loop()
-        with patch.object(loop, "sock_recv", new_callable=AsyncMock, return_value=b""):
+        with patch.object(loop, "sock_recv_into", new_callable=AsyncMock, return_value=0):
             await proxy._container_to_ssh()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
     async def test_data_written_to_process_stdout(self, proxy, mock_process):
         """Data from container should be written to process.stdout."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
-        call_count = 0
-
-        async def fake_recv(sock, size):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return b"hello from container"
-            return b""
-
         loop = asyncio.get_event_loop()
-        with patch.object(loop, "sock_recv", side_effect=fake_recv):
+        with patch.object(loop, "sock_recv_into", side_effect=recv_into_chunks(b"hello from container")):
             await proxy._container_to_ssh()
 
         mock_process.stdout.write.assert_called_with(b"hello from container")
 
     @pytest.mark.asyncio
-    async def test_blocking_io_error_with_continue(self, proxy, mock_process):
-        """BlockingIOError during read should continue to retry."""
+    async def test_blocking_io_error_not_retried(self, proxy, mock_process):
+        """sock_recv_into awaits readability itself, so there is no sleep-and-retry path."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
-        call_count = [0]
-
-        async def recv_with_blocking_io(sock, size):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise BlockingIOError("Resource temporarily unavailable")
-            elif call_count[0] == 2:
-                return b"data after retry"
-            return b""
-
         loop = asyncio.get_event_loop()
-        with patch.object(loop, "sock_recv", side_effect=recv_with_blocking_io):
-            await proxy._container_to_ssh()
+        with patch.object(loop, "sock_recv_into", side_effect=BlockingIOError) as mock_recv:
+            with patch("hermes.session.proxy.asyncio.sleep") as mock_sleep:
+                await proxy._container_to_ssh()
 
-        # Verify data was written after retry
-        mock_process.stdout.write.assert_called_with(b"data after retry")
-        assert proxy._shutdown_event.is_set()
+        mock_recv.assert_called_once()
+        mock_sleep.assert_not_called()
+        mock_process.stdout.write.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_connection_reset_error_in_container_to_ssh(self, proxy, mock_process):
-        """ConnectionResetError in container stream should set shutdown."""
+        """ConnectionResetError in container stream should end the task."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
         loop = asyncio.get_event_loop()
         with patch.object(
-            loop, "sock_recv", side_effect=ConnectionResetError("reset by peer")
+            loop, "sock_recv_into", side_effect=ConnectionResetError("reset by peer")
         ):
             await proxy._container_to_ssh()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
     async def test_broken_pipe_error_in_container_to_ssh(self, proxy, mock_process):
-        """BrokenPipeError in container stream should set shutdown."""
+        """BrokenPipeError in container stream should end the task."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
         loop = asyncio.get_event_loop()
         with patch.object(
-            loop, "sock_recv", side_effect=BrokenPipeError("pipe closed")
+            loop, "sock_recv_into", side_effect=BrokenPipeError("pipe closed")
         ):
             await proxy._container_to_ssh()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
     async def test_generic_exception_in_container_to_ssh(self, proxy, mock_process):
-        """Generic exception should set shutdown event and log."""
+        """Generic exception should end the task and log."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
         loop = asyncio.get_event_loop()
         with patch.object(
-            loop, "sock_recv", side_effect=RuntimeError("unexpected error")
+            loop, "sock_recv_into", side_effect=RuntimeError("unexpected error")
         ):
             await proxy._container_to_ssh()
 
-        assert proxy._shutdown_event.is_set()
-
     @pytest.mark.asyncio
     async def test_stdout_drain_called(self, proxy, mock_process):
         """stdout.drain() should be called after writing data."""
         proxy._running = True
         proxy.exec_socket = MagicMock()
 
-        call_count = [0]
+        loop = asyncio.get_event_loop()
+        with patch.object(loop, "sock_recv_into", side_effect=recv_into_chunks(b"test data")):
+            await proxy._container_to_ssh()
+
+        mock_process.stdout.drain.assert_called_once()
 
-        async def fake_recv(sock, size):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return b"test data"
-            return b""
+    @pytest.mark.asyncio
+    async def test_reads_into_reused_buffer(self, proxy, mock_process):
+        """Every read should target the proxy's preallocated 64 KiB buffer."""
+        proxy._running = True
+        proxy.exec_socket = MagicMock()
+        buffers = []
+
+        async def fake_recv_into(sock, buf):
+            buffers.append(buf)
+            if len(buffers) <= 2:
+                buf[:5] = b"chunk"
+                return 5
+            return 0
 
         loop = asyncio.get_event_loop()
-        with patch.object(loop, "sock_recv", side_effect=fake_recv):
+        with patch.object(loop, "sock_recv_into", side_effect=fake_recv_into):
             await proxy._container_to_ssh()
 
-        mock_process.stdout.drain.assert_called_once()
+        assert all(buf is proxy._recv_buf for buf in buffers)
+        assert len(proxy._recv_buf) == 65536
+        assert mock_process.stdout.write.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_only_bytes_read(self, proxy, mock_process):
+        """Only the filled prefix of the buffer should be forwarded."""
+        proxy._running = True
+        proxy.exec_socket = MagicMock()
+
+        loop = asyncio.get_event_loop()
+        with patch.object(loop, "sock_recv_into", side_effect=recv_into_chunks(b"prompt$ ")):
+            await proxy._container_to_ssh()
+
+        written = mock_process.stdout.write.call_args.args[0]
+        assert bytes(written) == b"prompt$ "
 
 
 class TestContainerProxyRecorder:
@@ -525,17 +539,8 @@ class TestContainerProxyRecorder:
         p._running = True
         p.exec_socket = MagicMock()
 
-        call_count = 0
-
-        async def fake_recv(sock, size):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return b"container output"
-            return b""
-
         loop = asyncio.get_event_loop()
-        with patch.object(loop, "sock_recv", side_effect=fake_recv):
+        with patch.object(loop, "sock_recv_into", side_effect=recv_into_chunks(b"container output")):
             await p._container_to_ssh()
 
         recorder.record_output.assert_called_with(b"container output")
@@ -3,10 +3,12 @@ Unit tests for container security configuration builder.
 """
 
 import pytest
+from unittest.mock import patch
 
 from hermes.config import ContainerSecurityConfig
 from hermes.container.security import (
     build_container_config,
+    build_container_config_template,
     format_cpu_quota,
     parse_memory_limit,
     _is_valid_memory_limit,
@@ -110,3 +112,33 @@ class TestBuildContainerConfig:
         config = ContainerSecurityConfig(cpu_quota=2.0)
         result = build_container_config(config, "img", "n")
         assert result["cpu_quota"] == 200000
+
+
+class TestBuildContainerConfigTemplate:
+    def test_template_has_no_per_container_fields(self, security_config: ContainerSecurityConfig):
+        template = build_container_config_template(security_config, "img")
+        assert "name" not in template
+        assert "labels" not in template
+
+    def test_template_matches_full_build(self, security_config: ContainerSecurityConfig):
+        template = build_container_config_template(security_config, "img")
+        full = build_container_config(security_config, "img", "n")
+        assert {k: v for k, v in full.items() if k not in ("name", "labels")} == template
+
+    def test_template_skips_revalidation(self, security_config: ContainerSecurityConfig):
+        template = build_container_config_template(security_config, "img")
+        with patch("hermes.container.security._is_valid_memory_limit") as mock_validate:
+            result = build_container_config(security_config, "img", "n", template=template)
+        mock_validate.assert_not_called()
+        assert result["name"] == "n"
+
+    def test_template_not_mutated(self, security_config: ContainerSecurityConfig):
+        template = build_container_config_template(security_config, "img")
+        build_container_config(security_config, "img", "a", session_id="s1", template=template)
+        assert "name" not in template
+        assert "labels" not in template
+
+    def test_invalid_memory_limit_raises(self):
+        config = ContainerSecurityConfig(memory_limit="bad")
+        with pytest.raises(ValueError, match="Invalid memory limit"):
+            build_container_config_template(config, "img")
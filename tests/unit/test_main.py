@@ -10,6 +10,10 @@ Tests cover:
 
 import argparse
 import asyncio
+import logging
+import os
+import signal
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,8 +21,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import docker
 
+import hermes
 from hermes import __version__
 from hermes.__main__ import (
+    _build_parser,
     parse_args,
     main,
     async_main,
@@ -210,6 +216,50 @@ class TestParseArgs:
         assert args.config == Path("/tmp/test.yaml")
         assert args.log_level == "DEBUG"
 
+    def test_workers_defaults_to_config(self):
+        """Should leave the worker count to the configuration file by default."""
+        with patch.object(sys, "argv", ["hermes"]):
+            args = parse_args()
+
+        assert args.workers is None
+
+    def test_workers_flag(self):
+        """Should parse --workers as an integer."""
+        with patch.object(sys, "argv", ["hermes", "--workers", "4"]):
+            args = parse_args()
+
+        assert args.workers == 4
+
+    def test_parser_is_built_once(self):
+        """The ArgumentParser should be reused while argv is still re-read."""
+        assert _build_parser() is _build_parser()
+        with patch.object(sys, "argv", ["hermes", "--workers", "2"]):
+            assert parse_args().workers == 2
+        with patch.object(sys, "argv", ["hermes", "--workers", "3"]):
+            assert parse_args().workers == 3
+
+    def test_help_does_not_import_heavy_dependencies(self):
+        """--help should not load docker, asyncssh or pydantic."""
+        code = (
+            "import sys\n"
+            "sys.argv = ['hermes', '--help']\n"
+            "import hermes.__main__\n"
+            "try:\n"
+            "    hermes.__main__.parse_args()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = [m for m in ('docker', 'asyncssh', 'pydantic') if m in sys.modules]\n"
+            "sys.stderr.write(','.join(loaded))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(Path(hermes.__file__).parent.parent)},
+        )
+        assert result.returncode == 0
+        assert result.stderr == ""
+
 
 # ============================================================================
 # Tests for setup_logging()
@@ -262,6 +312,7 @@ class TestMain:
                         config=Path("config.yaml"),
                         log_level="INFO",
                         generate_keys=False,
+                        workers=1,
                     )
                     mock_run.return_value = 0
 
@@ -282,6 +333,7 @@ class TestMain:
                         config=Path("config.yaml"),
                         log_level="INFO",
                         generate_keys=False,
+                        workers=1,
                     )
 
                     result = main()
@@ -312,6 +364,7 @@ class TestMain:
                         config=Path("config.yaml"),
                         log_level="DEBUG",
                         generate_keys=False,
+                        workers=1,
                     )
 
                     main()
@@ -328,15 +381,159 @@ class TestMain:
                         config=config_path,
                         log_level="INFO",
                         generate_keys=False,
+                        workers=1,
                     )
                     mock_async_main.return_value = 0
 
                     result = main()
 
                     # Verify async_main was called with the correct config path
-                    mock_async_main.assert_called_once_with(config_path)
+                    mock_async_main.assert_called_once_with(config_path, 1)
                     assert result == 0
 
+    def test_main_uses_uvloop_when_installed(self, caplog):
+        """Should run on uvloop's event loop when uvloop is importable."""
+        caplog.set_level(logging.INFO)
+        fake_uvloop = MagicMock()
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+                    with patch("hermes.__main__.asyncio.run", return_value=0) as mock_run:
+                        mock_parse.return_value = argparse.Namespace(
+                            config=Path("config.yaml"),
+                            log_level="INFO",
+                            generate_keys=False,
+                            workers=1,
+                        )
+
+                        main()
+
+                        mock_run.call_args.args[0].close()
+                        assert mock_run.call_args.kwargs == {
+                            "loop_factory": fake_uvloop.new_event_loop
+                        }
+                        assert "Using uvloop event loop" in caplog.text
+
+    def test_main_falls_back_without_uvloop(self, caplog):
+        """Should use the default event loop when uvloop is not installed."""
+        caplog.set_level(logging.INFO)
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch.dict(sys.modules, {"uvloop": None}):
+                    with patch("hermes.__main__.asyncio.run", return_value=0) as mock_run:
+                        mock_parse.return_value = argparse.Namespace(
+                            config=Path("config.yaml"),
+                            log_level="INFO",
+                            generate_keys=False,
+                            workers=1,
+                        )
+
+                        main()
+
+                        mock_run.call_args.args[0].close()
+                        assert mock_run.call_args.kwargs == {}
+                        assert "Using default asyncio event loop" in caplog.text
+
+    def test_main_forks_extra_workers(self):
+        """Should fork workers - 1 children, run the server, then reap children."""
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch("hermes.__main__.asyncio.run", return_value=0) as mock_run:
+                    with patch("hermes.__main__.os.fork", side_effect=[101, 102]) as mock_fork:
+                        with patch("hermes.__main__.os.kill") as mock_kill:
+                            with patch("hermes.__main__.os.waitpid") as mock_waitpid:
+                                mock_parse.return_value = argparse.Namespace(
+                                    config=Path("config.yaml"),
+                                    log_level="INFO",
+                                    generate_keys=False,
+                                    workers=3,
+                                )
+
+                                result = main()
+
+                                mock_run.call_args.args[0].close()
+                                assert result == 0
+                                assert mock_fork.call_count == 2
+                                assert mock_kill.call_count == 2
+                                mock_waitpid.assert_any_call(101, 0)
+                                mock_waitpid.assert_any_call(102, 0)
+
+    def test_main_child_worker_does_not_reap(self):
+        """A forked child should run the server without reaping anything."""
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch("hermes.__main__.asyncio.run", return_value=0) as mock_run:
+                    with patch("hermes.__main__.os.fork", return_value=0) as mock_fork:
+                        with patch("hermes.__main__.os.waitpid") as mock_waitpid:
+                            mock_parse.return_value = argparse.Namespace(
+                                config=Path("config.yaml"),
+                                log_level="INFO",
+                                generate_keys=False,
+                                workers=2,
+                            )
+
+                            result = main()
+
+                            mock_run.call_args.args[0].close()
+                            assert result == 0
+                            mock_fork.assert_called_once()
+                            mock_waitpid.assert_not_called()
+
+    def test_main_reads_workers_from_config(self, mock_config):
+        """Without --workers, server.workers from the config file should be used."""
+        mock_config.server.workers = 2
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch("hermes.config.Config.from_file", return_value=mock_config):
+                    with patch("hermes.__main__.asyncio.run", return_value=0):
+                        with patch("hermes.__main__.os.fork", return_value=0) as mock_fork:
+                            with patch("hermes.__main__.async_main") as mock_async_main:
+                                mock_parse.return_value = argparse.Namespace(
+                                    config=Path("config.yaml"),
+                                    log_level="INFO",
+                                    generate_keys=False,
+                                    workers=None,
+                                )
+
+                                assert main() == 0
+                                mock_fork.assert_called_once()
+                                mock_async_main.assert_called_once_with(Path("config.yaml"), 2)
+
+    def test_main_single_worker_when_config_unreadable(self):
+        """A config that cannot be loaded should leave reporting to async_main."""
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch("hermes.__main__.asyncio.run", return_value=1):
+                    with patch("hermes.__main__.os.fork") as mock_fork:
+                        with patch("hermes.__main__.async_main") as mock_async_main:
+                            mock_parse.return_value = argparse.Namespace(
+                                config=Path("/nonexistent/config.yaml"),
+                                log_level="INFO",
+                                generate_keys=False,
+                                workers=None,
+                            )
+
+                            assert main() == 1
+                            mock_fork.assert_not_called()
+                            mock_async_main.assert_called_once_with(
+                                Path("/nonexistent/config.yaml"), 1
+                            )
+
+    def test_main_rejects_zero_workers(self):
+        """Should refuse to start with fewer than one worker."""
+        with patch("hermes.__main__.parse_args") as mock_parse:
+            with patch("hermes.__main__.setup_logging"):
+                with patch("hermes.__main__.asyncio.run") as mock_run:
+                    mock_parse.return_value = argparse.Namespace(
+                        config=Path("config.yaml"),
+                        log_level="INFO",
+                        generate_keys=False,
+                        workers=0,
+                    )
+
+                    assert main() == 1
+                    mock_run.assert_not_called()
+
 
 # ============================================================================
 # Tests for async_main()
@@ -351,10 +548,10 @@ class TestAsyncMain:
         """Should successfully start SSH server and initialize pool."""
         config_path = Path("config.yaml")
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
-            with patch("hermes.__main__.docker.from_env") as mock_docker_from_env:
-                with patch("hermes.__main__.ContainerPool") as MockPool:
-                    with patch("hermes.__main__.AsyncSSHBackend") as MockBackend:
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env") as mock_docker_from_env:
+                with patch("hermes.container.pool.ContainerPool") as MockPool:
+                    with patch("hermes.server.asyncssh_backend.AsyncSSHBackend") as MockBackend:
                         # Setup mocks
                         client = MagicMock()
                         client.version.return_value = {"Version": "20.10.0"}
@@ -386,13 +583,38 @@ class TestAsyncMain:
 
                             assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_async_main_stops_on_sigterm(
+        self, mock_config, mock_docker_client, mock_pool, mock_ssh_backend
+    ):
+        """SIGTERM should stop the server cleanly and restore signal handling."""
+        config_path = Path("config.yaml")
+        loop = asyncio.get_running_loop()
+        mock_ssh_backend.start.side_effect = lambda: loop.call_soon(
+            os.kill, os.getpid(), signal.SIGTERM
+        )
+
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env", return_value=mock_docker_client):
+                with patch("hermes.container.pool.ContainerPool", return_value=mock_pool):
+                    with patch(
+                        "hermes.server.asyncssh_backend.AsyncSSHBackend",
+                        return_value=mock_ssh_backend,
+                    ):
+                        result = await asyncio.wait_for(async_main(config_path), timeout=5)
+
+        assert result == 0
+        mock_ssh_backend.stop.assert_called_once()
+        mock_pool.shutdown.assert_called_once()
+        assert signal.getsignal(signal.SIGTERM) == signal.SIG_DFL
+
     @pytest.mark.asyncio
     async def test_async_main_config_file_not_found(self):
         """Should return error code when config file missing."""
         config_path = Path("nonexistent.yaml")
 
         with patch(
-            "hermes.__main__.Config.from_file",
+            "hermes.config.Config.from_file",
             side_effect=FileNotFoundError("not found"),
         ):
             result = await async_main(config_path)
@@ -404,23 +626,41 @@ class TestAsyncMain:
         """Should return error code when Docker not accessible."""
         config_path = Path("config.yaml")
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
             with patch(
-                "hermes.__main__.docker.from_env",
+                "docker.from_env",
                 side_effect=docker.errors.DockerException("Cannot connect to Docker"),
             ):
                 result = await async_main(config_path)
 
                 assert result == 1
 
+    @pytest.mark.asyncio
+    async def test_async_main_docker_version_failure(
+        self, mock_config, mock_docker_client, mock_pool
+    ):
+        """A failed version check should wait for pool init, then clean up."""
+        config_path = Path("config.yaml")
+        mock_docker_client.version.side_effect = docker.errors.APIError("daemon gone")
+
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env", return_value=mock_docker_client):
+                with patch("hermes.container.pool.ContainerPool", return_value=mock_pool):
+                    result = await async_main(config_path)
+
+        assert result == 1
+        mock_pool.initialize.assert_awaited_once()
+        mock_pool.shutdown.assert_awaited_once()
+        mock_docker_client.close.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_async_main_pool_initialization_failure(self, mock_config):
         """Should cleanup and return error code if pool init fails."""
         config_path = Path("config.yaml")
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
-            with patch("hermes.__main__.docker.from_env") as mock_docker_from_env:
-                with patch("hermes.__main__.ContainerPool") as MockPool:
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env") as mock_docker_from_env:
+                with patch("hermes.container.pool.ContainerPool") as MockPool:
                     client = MagicMock()
                     client.version.return_value = {"Version": "20.10.0"}
                     client.close = MagicMock()
@@ -442,10 +682,10 @@ class TestAsyncMain:
         """Should properly cleanup resources on shutdown."""
         config_path = Path("config.yaml")
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
-            with patch("hermes.__main__.docker.from_env") as mock_docker_from_env:
-                with patch("hermes.__main__.ContainerPool") as MockPool:
-                    with patch("hermes.__main__.AsyncSSHBackend") as MockBackend:
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env") as mock_docker_from_env:
+                with patch("hermes.container.pool.ContainerPool") as MockPool:
+                    with patch("hermes.server.asyncssh_backend.AsyncSSHBackend") as MockBackend:
                         client = MagicMock()
                         client.version.return_value = {"Version": "20.10.0"}
                         client.close = MagicMock()
@@ -484,10 +724,10 @@ class TestAsyncMain:
         config_path = Path("config.yaml")
         mock_config.docker.base_url = "unix:///var/run/docker.sock"
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
-            with patch("hermes.__main__.docker.DockerClient") as MockDockerClient:
-                with patch("hermes.__main__.ContainerPool") as MockPool:
-                    with patch("hermes.__main__.AsyncSSHBackend") as MockBackend:
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.DockerClient") as MockDockerClient:
+                with patch("hermes.container.pool.ContainerPool") as MockPool:
+                    with patch("hermes.server.asyncssh_backend.AsyncSSHBackend") as MockBackend:
                         client = MagicMock()
                         client.version.return_value = {"Version": "20.10.0"}
                         client.close = MagicMock()
@@ -516,18 +756,41 @@ class TestAsyncMain:
                             )
 
                             MockDockerClient.assert_called_once_with(
-                                base_url="unix:///var/run/docker.sock"
+                                base_url="unix:///var/run/docker.sock", max_pool_size=13
                             )
 
+    @pytest.mark.asyncio
+    async def test_async_main_docker_pool_never_below_default(
+        self, mock_config, mock_docker_client, mock_pool, mock_ssh_backend
+    ):
+        """Small deployments should keep docker's default connection pool size."""
+        config_path = Path("config.yaml")
+        mock_config.server.max_concurrent_sessions = 2
+        mock_config.container_pool.size = 1
+
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env", return_value=mock_docker_client) as mock_from_env:
+                with patch("hermes.container.pool.ContainerPool", return_value=mock_pool):
+                    with patch(
+                        "hermes.server.asyncssh_backend.AsyncSSHBackend",
+                        return_value=mock_ssh_backend,
+                    ):
+                        with patch("hermes.__main__.asyncio.Event") as MockEvent:
+                            MockEvent.return_value.wait = AsyncMock()
+
+                            await async_main(config_path)
+
+        mock_from_env.assert_called_once_with(max_pool_size=10)
+
     @pytest.mark.asyncio
     async def test_async_main_registers_session_handler(self, mock_config):
         """Should register session handler with SSH backend."""
         config_path = Path("config.yaml")
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
-            with patch("hermes.__main__.docker.from_env") as mock_docker_from_env:
-                with patch("hermes.__main__.ContainerPool") as MockPool:
-                    with patch("hermes.__main__.AsyncSSHBackend") as MockBackend:
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
+            with patch("docker.from_env") as mock_docker_from_env:
+                with patch("hermes.container.pool.ContainerPool") as MockPool:
+                    with patch("hermes.server.asyncssh_backend.AsyncSSHBackend") as MockBackend:
                         client = MagicMock()
                         client.version.return_value = {"Version": "20.10.0"}
                         client.close = MagicMock()
@@ -563,9 +826,9 @@ class TestAsyncMain:
         """Should catch and handle unexpected exceptions."""
         config_path = Path("config.yaml")
 
-        with patch("hermes.__main__.Config.from_file", return_value=mock_config):
+        with patch("hermes.config.Config.from_file", return_value=mock_config):
             with patch(
-                "hermes.__main__.docker.from_env",
+                "docker.from_env",
                 side_effect=RuntimeError("Unexpected error"),
             ):
                 result = await async_main(config_path)
@@ -588,7 +851,7 @@ class TestContainerSessionHandler:
         """Should allocate container and release after completion."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
             await container_session_handler(
@@ -609,14 +872,14 @@ class TestContainerSessionHandler:
         recording_config.enabled = True
         recording_config.output_dir = Path("/tmp/recordings")
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
-            with patch("hermes.__main__.SessionRecorder") as MockRecorder:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
+            with patch("hermes.session.recorder.SessionRecorder") as MockRecorder:
                 proxy_instance = AsyncMock()
                 MockProxy.return_value = proxy_instance
 
                 recorder_instance = MagicMock()
                 recorder_instance.start = MagicMock()
-                recorder_instance.stop = MagicMock()
+                recorder_instance.stop = AsyncMock()
                 recorder_instance.write_metadata = MagicMock()
                 MockRecorder.return_value = recorder_instance
 
@@ -641,7 +904,7 @@ class TestContainerSessionHandler:
         """Should start proxy and wait for completion."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -691,7 +954,7 @@ class TestContainerSessionHandler:
         """Should release container even if proxy.start() fails."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.start.side_effect = RuntimeError("exec failed")
             proxy_instance.stop = AsyncMock()
@@ -708,7 +971,7 @@ class TestContainerSessionHandler:
         """Should always stop proxy even on error."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -732,14 +995,14 @@ class TestContainerSessionHandler:
         recording_config.enabled = True
         recording_config.output_dir = Path("/tmp/recordings")
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
-            with patch("hermes.__main__.SessionRecorder") as MockRecorder:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
+            with patch("hermes.session.recorder.SessionRecorder") as MockRecorder:
                 proxy_instance = AsyncMock()
                 MockProxy.return_value = proxy_instance
 
                 recorder_instance = MagicMock()
                 recorder_instance.start = MagicMock()
-                recorder_instance.stop = MagicMock()
+                recorder_instance.stop = AsyncMock()
                 recorder_instance.write_metadata = MagicMock()
                 MockRecorder.return_value = recorder_instance
 
@@ -763,8 +1026,8 @@ class TestContainerSessionHandler:
         """Should not create recorder when recording is None."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
-            with patch("hermes.__main__.SessionRecorder") as MockRecorder:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
+            with patch("hermes.session.recorder.SessionRecorder") as MockRecorder:
                 proxy_instance = AsyncMock()
                 MockProxy.return_value = proxy_instance
 
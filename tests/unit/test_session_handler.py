@@ -48,7 +48,7 @@ class TestContainerSessionHandler:
         """Should allocate a container and release it after proxy completes."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -66,7 +66,7 @@ class TestContainerSessionHandler:
         """Should create ContainerProxy with the process object (not ssh_session)."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -89,7 +89,7 @@ class TestContainerSessionHandler:
         """Should call proxy.start() then proxy.wait_completion()."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -107,7 +107,7 @@ class TestContainerSessionHandler:
         """Proxy.stop() should always be called during cleanup."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
@@ -152,7 +152,7 @@ class TestContainerSessionHandler:
         """Should write "Proxy initialization failed" when proxy.start() fails."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.start.side_effect = RuntimeError("exec failed")
             MockProxy.return_value = proxy_instance
@@ -172,7 +172,7 @@ class TestContainerSessionHandler:
         """Should not call set_container_proxy (removed in phase 4 fix)."""
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             MockProxy.return_value = proxy_instance
 
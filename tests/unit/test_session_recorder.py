@@ -2,7 +2,9 @@
 Unit tests for SessionRecorder (asciicast v2 format).
 """
 
+import asyncio
 import json
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,7 +12,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hermes.config import RecordingConfig
-from hermes.session.recorder import SessionRecorder
+from hermes.session.recorder import SessionRecorder, _get_writer
 
 
 @pytest.fixture
@@ -55,6 +57,11 @@ def _cast_path(recording_config: RecordingConfig) -> Path:
     return recording_config.output_dir / "test-session-001.cast"
 
 
+def _drain() -> None:
+    """Wait until the shared writer thread has finished queued writes."""
+    _get_writer().submit(lambda: None).result()
+
+
 def _parse_cast(path: Path) -> list:
     """Parse a .cast file into [header_dict, event1, event2, ...]."""
     lines = path.read_text(encoding="utf-8").strip().splitlines()
@@ -98,60 +105,60 @@ class TestSessionRecorderInit:
 class TestSessionRecorderStart:
     """Tests for start() — directory creation and header writing."""
 
-    def test_creates_output_directory(
+    async def test_creates_output_directory(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         assert recording_config.output_dir.is_dir()
-        recorder.stop()
+        await recorder.stop()
 
-    def test_creates_cast_file(
+    async def test_creates_cast_file(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         assert _cast_path(recording_config).exists()
-        recorder.stop()
+        await recorder.stop()
 
-    def test_sets_active(self, recorder: SessionRecorder):
+    async def test_sets_active(self, recorder: SessionRecorder):
         recorder.start()
         assert recorder.active is True
-        recorder.stop()
+        await recorder.stop()
 
-    def test_header_version(
+    async def test_header_version(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
-        recorder.stop()
+        await recorder.stop()
         header = _parse_cast(_cast_path(recording_config))[0]
         assert header["version"] == 2
 
-    def test_header_dimensions(
+    async def test_header_dimensions(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
-        recorder.stop()
+        await recorder.stop()
         header = _parse_cast(_cast_path(recording_config))[0]
         assert header["width"] == 80
         assert header["height"] == 24
 
-    def test_header_timestamp_is_epoch(
+    async def test_header_timestamp_is_epoch(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         before = int(time.time())
         recorder.start()
-        recorder.stop()
+        await recorder.stop()
         after = int(time.time())
         header = _parse_cast(_cast_path(recording_config))[0]
         assert before <= header["timestamp"] <= after
 
-    def test_header_contains_metadata(
+    async def test_header_contains_metadata(
         self,
         recorder: SessionRecorder,
         recording_config: RecordingConfig,
         metadata: dict,
     ):
         recorder.start()
-        recorder.stop()
+        await recorder.stop()
         header = _parse_cast(_cast_path(recording_config))[0]
         assert header["env"]["username"] == metadata["username"]
         assert header["env"]["source_ip"] == metadata["source_ip"]
@@ -169,12 +176,12 @@ class TestSessionRecorderStart:
 class TestSessionRecorderEvents:
     """Tests for recording I/O and resize events."""
 
-    def test_record_output_format(
+    async def test_record_output_format(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         recorder.record_output(b"Hello\r\n")
-        recorder.stop()
+        await recorder.stop()
         events = _parse_cast(_cast_path(recording_config))
         event = events[1]  # first event after header
         assert isinstance(event[0], float)
@@ -182,47 +189,78 @@ class TestSessionRecorderEvents:
         assert event[1] == "o"
         assert event[2] == "Hello\r\n"
 
-    def test_record_input_format(
+    async def test_record_input_format(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         recorder.record_input(b"ls -la\n")
-        recorder.stop()
+        await recorder.stop()
         event = _parse_cast(_cast_path(recording_config))[1]
         assert event[1] == "i"
         assert event[2] == "ls -la\n"
 
-    def test_record_resize_format(
+    async def test_record_resize_format(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         recorder.record_resize(120, 40)
-        recorder.stop()
+        await recorder.stop()
         event = _parse_cast(_cast_path(recording_config))[1]
         assert event[1] == "r"
         assert event[2] == "120x40"
 
-    def test_elapsed_time_increases(
+    async def test_elapsed_time_increases(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         recorder.record_output(b"first")
         time.sleep(0.02)
         recorder.record_output(b"second")
-        recorder.stop()
+        await recorder.stop()
         events = _parse_cast(_cast_path(recording_config))
         assert events[2][0] > events[1][0]
 
-    def test_binary_data_decoded_with_replacement(
+    async def test_elapsed_time_formatted_from_integer_ns(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        with patch("hermes.session.recorder.time.monotonic_ns", side_effect=[0, 3_000_999_999]):
+            recorder.start()
+            recorder.record_output(b"x")
+        await recorder.stop()
+        raw = _cast_path(recording_config).read_bytes().splitlines()[1]
+        assert raw.startswith(b"[3.000999,")
+
+    async def test_binary_data_decoded_with_replacement(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
         recorder.record_output(b"\x80\xff hello")
-        recorder.stop()
+        await recorder.stop()
         event = _parse_cast(_cast_path(recording_config))[1]
         assert "\ufffd" in event[2]
         assert "hello" in event[2]
 
+    async def test_special_characters_round_trip(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        text = 'q"b\\s\x1b[0m\t\u00e9\U0001f600\r\n'
+        recorder.start()
+        recorder.record_output(text.encode("utf-8"))
+        await recorder.stop()
+        raw = _cast_path(recording_config).read_bytes().splitlines()[1]
+        assert raw.isascii()
+        assert json.loads(raw)[2] == text
+
+    async def test_record_output_accepts_memoryview(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        """The proxy hands over views into its reused receive buffer."""
+        recorder.start()
+        recorder.record_output(memoryview(bytearray(b"from buffer")))
+        await recorder.stop()
+        event = _parse_cast(_cast_path(recording_config))[1]
+        assert event[2] == "from buffer"
+
     def test_events_noop_when_not_started(self, recorder: SessionRecorder):
         """Events before start() should not raise or create files."""
         recorder.record_output(b"data")
@@ -230,7 +268,7 @@ class TestSessionRecorderEvents:
         recorder.record_resize(80, 24)
         # no exception is success
 
-    def test_events_noop_when_disabled(
+    async def test_events_noop_when_disabled(
         self, disabled_config: RecordingConfig
     ):
         rec = SessionRecorder(
@@ -239,9 +277,9 @@ class TestSessionRecorderEvents:
         rec.start()
         rec.record_output(b"data")  # should not raise
         rec.record_input(b"data")
-        rec.stop()
+        await rec.stop()
 
-    def test_event_count_tracked(
+    async def test_event_count_tracked(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
@@ -249,9 +287,9 @@ class TestSessionRecorderEvents:
         recorder.record_input(b"b")
         recorder.record_resize(100, 50)
         assert recorder._event_count == 3
-        recorder.stop()
+        await recorder.stop()
 
-    def test_write_error_does_not_raise(
+    async def test_write_error_does_not_raise(
         self, recorder: SessionRecorder
     ):
         """I/O error during write should be swallowed."""
@@ -259,33 +297,157 @@ class TestSessionRecorderEvents:
         # Simulate write failure
         recorder._file.write = MagicMock(side_effect=OSError("disk full"))
         recorder.record_output(b"data")  # should not raise
-        recorder.stop()
+        await recorder.stop()
+
+    def test_write_error_deactivates_recorder(self, recorder: SessionRecorder):
+        """After a failed write the recorder stops and later events are dropped."""
+        recorder.start()
+        write = MagicMock(side_effect=OSError("disk full"))
+        recorder._file.write = write
+        recorder.record_output(b"data")
+        recorder.flush()
+        _drain()
+        recorder.record_output(b"more")
+        recorder.flush()
+        assert recorder.active is False
+        recorder.record_output(b"ignored")
+        assert write.call_count == 1
+
+
+class TestSessionRecorderBuffering:
+    """Tests for buffered event writes."""
+
+    async def test_events_not_flushed_per_event(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        recorder.start()
+        recorder.record_output(b"pending")
+        assert "pending" not in _cast_path(recording_config).read_text()
+        await recorder.stop()
+        assert "pending" in _cast_path(recording_config).read_text()
+
+    async def test_flush_writes_buffered_events(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        recorder.start()
+        recorder.record_output(b"pending")
+        recorder.flush()
+        _drain()
+        assert "pending" in _cast_path(recording_config).read_text()
+        await recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes_inside_event_loop(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        with patch("hermes.session.recorder._FLUSH_INTERVAL", 0.01):
+            recorder.start()
+            recorder.record_output(b"first")
+            recorder.record_output(b"second")
+            await asyncio.sleep(0.05)
+        _drain()
+        text = _cast_path(recording_config).read_text()
+        assert "first" in text and "second" in text
+        assert recorder._flush_handle is None
+        await recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_flush(self, recorder: SessionRecorder):
+        recorder.start()
+        recorder.record_output(b"data")
+        handle = recorder._flush_handle
+        assert handle is not None
+        await recorder.stop()
+        assert handle.cancelled()
+        assert recorder._flush_handle is None
+
+    def test_flush_noop_when_not_started(self, recorder: SessionRecorder):
+        recorder.flush()  # should not raise
+
+    async def test_full_batch_flushes_without_timer(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        with patch("hermes.session.recorder._WRITE_BUFFER_SIZE", 16):
+            recorder.start()
+            recorder.record_output(b"a long enough event")
+        assert recorder._pending == []
+        _drain()
+        assert "a long enough event" in _cast_path(recording_config).read_text()
+        await recorder.stop()
+
+    async def test_writes_run_on_writer_thread(self, recorder: SessionRecorder):
+        recorder.start()
+        threads = []
+        original = recorder._file.write
+
+        def write(data):
+            threads.append(threading.current_thread().name)
+            return original(data)
+
+        recorder._file.write = write
+        recorder.record_output(b"data")
+        await recorder.stop()
+        assert threads
+        assert all(name.startswith("hermes-recorder") for name in threads)
+
+    async def test_recordings_share_one_writer(self, recording_config: RecordingConfig):
+        threads = set()
+        recorders = [
+            SessionRecorder(config=recording_config, session_id=f"shared-{i}")
+            for i in range(3)
+        ]
+        for rec in recorders:
+            rec.start()
+            original = rec._file.write
+
+            def write(data, original=original):
+                threads.add(threading.get_ident())
+                return original(data)
+
+            rec._file.write = write
+            rec.record_output(b"data")
+        for rec in recorders:
+            await rec.stop()
+        assert len(threads) == 1
+
+    async def test_events_dropped_when_queue_full(
+        self, recorder: SessionRecorder, recording_config: RecordingConfig
+    ):
+        with patch("hermes.session.recorder._MAX_QUEUED_SIZE", 64):
+            recorder.start()
+            for _ in range(10):
+                recorder.record_output(b"0123456789")
+        assert recorder._dropped_events > 0
+        assert recorder._event_count + recorder._dropped_events == 10
+        await recorder.stop()
+        events = _parse_cast(_cast_path(recording_config))[1:]
+        assert len(events) == recorder._event_count
 
 
 class TestSessionRecorderStop:
     """Tests for stop() and metadata writing."""
 
-    def test_stop_sets_inactive(self, recorder: SessionRecorder):
+    async def test_stop_sets_inactive(self, recorder: SessionRecorder):
         recorder.start()
-        recorder.stop()
+        await recorder.stop()
         assert recorder.active is False
 
-    def test_stop_safe_to_call_twice(self, recorder: SessionRecorder):
+    async def test_stop_safe_to_call_twice(self, recorder: SessionRecorder):
         recorder.start()
-        recorder.stop()
-        recorder.stop()  # should not raise
+        await recorder.stop()
+        await recorder.stop()  # should not raise
 
-    def test_stop_safe_when_never_started(self, recorder: SessionRecorder):
-        recorder.stop()  # should not raise
+    async def test_stop_safe_when_never_started(self, recorder: SessionRecorder):
+        await recorder.stop()  # should not raise
 
-    def test_write_metadata_creates_json(
+    async def test_write_metadata_creates_json(
         self,
         recorder: SessionRecorder,
         recording_config: RecordingConfig,
         metadata: dict,
     ):
         recorder.start()
-        recorder.stop()
+        await recorder.stop()
         recorder.write_metadata()
         json_path = recording_config.output_dir / "test-session-001.json"
         assert json_path.exists()
@@ -307,7 +469,7 @@ class TestSessionRecorderStop:
 class TestSessionRecorderFullLifecycle:
     """End-to-end test parsing a complete .cast file."""
 
-    def test_full_session_cast_file(
+    async def test_full_session_cast_file(
         self, recorder: SessionRecorder, recording_config: RecordingConfig
     ):
         recorder.start()
@@ -316,7 +478,7 @@ class TestSessionRecorderFullLifecycle:
         recorder.record_output(b"root\r\n$ ")
         recorder.record_resize(120, 40)
         recorder.record_input(b"exit\n")
-        recorder.stop()
+        await recorder.stop()
 
         cast = _parse_cast(_cast_path(recording_config))
 
@@ -354,7 +516,7 @@ class TestSessionRecorderFullLifecycle:
         for i in range(1, len(elapsed_times)):
             assert elapsed_times[i] >= elapsed_times[i - 1]
 
-    def test_full_lifecycle_with_metadata(
+    async def test_full_lifecycle_with_metadata(
         self,
         recorder: SessionRecorder,
         recording_config: RecordingConfig,
@@ -362,7 +524,7 @@ class TestSessionRecorderFullLifecycle:
     ):
         recorder.start()
         recorder.record_output(b"hello")
-        recorder.stop()
+        await recorder.stop()
         recorder.write_metadata()
 
         # Both files exist
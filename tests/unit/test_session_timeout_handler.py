@@ -76,7 +76,7 @@ class TestTimeoutParameterHandling:
         config = Config()
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.wait_completion = AsyncMock(return_value=None)
             MockProxy.return_value = proxy_instance
@@ -93,16 +93,16 @@ class TestTimeoutParameterHandling:
     ):
         """Verify handler accepts recording configuration."""
         config = Config()
-        recording = RecordingConfig(enabled=False)
+        recording = RecordingConfig(enabled=True)
         config.recording = recording
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.SessionRecorder") as MockRecorder:
+        with patch("hermes.session.recorder.SessionRecorder") as MockRecorder:
             mock_pool.allocate.return_value = mock_container
             rec_instance = AsyncMock()
             MockRecorder.return_value = rec_instance
 
-            with patch("hermes.__main__.ContainerProxy") as MockProxy:
+            with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
                 proxy_instance = AsyncMock()
                 proxy_instance.wait_completion = AsyncMock(return_value=None)
                 MockProxy.return_value = proxy_instance
@@ -114,6 +114,27 @@ class TestTimeoutParameterHandling:
         assert rec_instance.start.called
         assert rec_instance.stop.called
 
+    async def test_handler_skips_disabled_recording(
+        self, session_info, pty_request, mock_process, mock_container, mock_pool
+    ):
+        """Verify no recorder is created when recording is disabled."""
+        config = Config()
+        recording = RecordingConfig(enabled=False)
+        mock_pool.allocate.return_value = mock_container
+
+        with patch("hermes.session.recorder.SessionRecorder") as MockRecorder:
+            with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
+                proxy_instance = AsyncMock()
+                proxy_instance.wait_completion = AsyncMock(return_value=None)
+                MockProxy.return_value = proxy_instance
+
+                await container_session_handler(
+                    session_info, pty_request, mock_process, mock_pool, config, recording
+                )
+
+        MockRecorder.assert_not_called()
+        assert MockProxy.call_args.kwargs["recorder"] is None
+
     async def test_handler_uses_server_config_timeout(
         self, session_info, pty_request, mock_process, mock_container, mock_pool
     ):
@@ -122,7 +143,7 @@ class TestTimeoutParameterHandling:
         config = Config(server=ServerConfig(session_timeout=short_timeout))
         mock_pool.allocate.return_value = mock_container
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.wait_completion = AsyncMock(return_value=None)
             MockProxy.return_value = proxy_instance
@@ -146,7 +167,7 @@ class TestTimeoutParameterHandling:
         async def slow_completion() -> None:
             await asyncio.sleep(short_timeout * 4)  # outlives the timeout
 
-        with patch("hermes.__main__.ContainerProxy") as MockProxy:
+        with patch("hermes.session.proxy.ContainerProxy") as MockProxy:
             proxy_instance = AsyncMock()
             proxy_instance.wait_completion = AsyncMock(side_effect=slow_completion)
             MockProxy.return_value = proxy_instance